@@ -0,0 +1,68 @@
+"""Shared subprocess helpers, aware of the Flatpak sandbox.
+
+One copy of the run-command/run-shell plumbing instead of a verbatim
+clone per module. Prefer run_command (argv, no shell) whenever the
+command needs no pipes or globbing; every avoided shell is one fewer
+fork plus bash startup.
+"""
+
+import subprocess
+from typing import Sequence
+
+from .systemd_client import is_flatpak, run_host_shell
+
+
+# Sandbox status is fixed for the process; compute the prefix once
+_IN_FLATPAK = is_flatpak()
+_CMD_PREFIX = ("flatpak-spawn", "--host") if _IN_FLATPAK else ()
+
+
+def run_command(cmd: Sequence[str], timeout: float = 10) -> tuple[bool, str]:
+    """Run an argv command, using flatpak-spawn if in Flatpak sandbox."""
+    cmd = [*_CMD_PREFIX, *cmd]
+    try:
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=timeout
+        )
+        return result.returncode == 0, result.stdout + result.stderr
+    except Exception as e:
+        return False, str(e)
+
+
+def run_command_with_stdin(cmd: Sequence[str], stdin_bytes: bytes,
+                           timeout: float = 30) -> tuple[bool, str]:
+    """Run a command with bytes fed on stdin (flatpak-aware)."""
+    cmd = [*_CMD_PREFIX, *cmd]
+    try:
+        result = subprocess.run(
+            cmd,
+            input=stdin_bytes,
+            capture_output=True,
+            timeout=timeout
+        )
+        output = (result.stdout + result.stderr).decode("utf-8", errors="replace")
+        return result.returncode == 0, output
+    except Exception as e:
+        return False, str(e)
+
+
+def run_shell(cmd: str, timeout: float = 10) -> tuple[bool, str]:
+    """Run a shell command; reserve for pipelines that truly need one."""
+    if _IN_FLATPAK:
+        # Reuse the persistent host shell instead of spawning
+        # flatpak-spawn + bash per call
+        return run_host_shell(cmd, timeout)
+    try:
+        result = subprocess.run(
+            cmd,
+            shell=True,
+            capture_output=True,
+            text=True,
+            timeout=timeout
+        )
+        return result.returncode == 0, result.stdout
+    except Exception as e:
+        return False, str(e)
@@ -1,14 +1,23 @@
 """Configuration file detection and access."""
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-from .systemd_client import is_flatpak
+from .fs_cache import dir_names, path_exists
+from .systemd_client import is_flatpak, run_host_shell
+import os
 import subprocess
 
 
-@dataclass
+# Shared pool for running independent filesystem probes concurrently.
+# The probes are latency-bound (stat syscalls release the GIL), so
+# fanning them out collapses total wall-time to the slowest probe.
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="config-probe")
+
+
+@dataclass(frozen=True, slots=True)
 class ConfigFile:
     """Represents a configuration file."""
     name: str
@@ -19,7 +28,10 @@ class ConfigFile:
 def _run_shell(cmd: str) -> tuple[bool, str]:
     """Run a shell command."""
     if is_flatpak():
-        cmd = f"flatpak-spawn --host bash -c '{cmd}'"
+        # Reuse the persistent host shell instead of spawning
+        # flatpak-spawn + bash per call
+        success, output = run_host_shell(cmd)
+        return success, output.strip()
     try:
         result = subprocess.run(
             cmd,
@@ -34,9 +46,15 @@ def _run_shell(cmd: str) -> tuple[bool, str]:
 
 
 def _find_file(paths: list[str]) -> Optional[str]:
-    """Find the first existing file from a list of paths."""
+    """Find the first existing file from a list of paths.
+
+    Checks membership in a cached directory listing, so candidates that
+    share a parent (the versioned /etc/php paths) cost one scandir rather
+    than one stat each.
+    """
     for path in paths:
-        if Path(path).exists():
+        parent, name = os.path.split(path)
+        if name in dir_names(parent):
             return path
     return None
 
@@ -172,7 +190,7 @@ def get_mysql_configs() -> list[ConfigFile]:
 
 def get_hosts_file() -> Optional[ConfigFile]:
     """Get the hosts file."""
-    if Path("/etc/hosts").exists():
+    if path_exists("/etc/hosts"):
         return ConfigFile("hosts", "/etc/hosts", "system")
     return None
 
@@ -181,19 +199,26 @@ def get_all_configs() -> dict[str, list[ConfigFile]]:
     """Get all configuration files grouped by category."""
     configs = {}
 
-    nginx = get_nginx_configs()
+    # Run the four independent probes concurrently; each issues several
+    # stat syscalls, so total latency collapses to the slowest one.
+    nginx_f = _EXECUTOR.submit(get_nginx_configs)
+    php_f = _EXECUTOR.submit(get_php_configs)
+    mysql_f = _EXECUTOR.submit(get_mysql_configs)
+    hosts_f = _EXECUTOR.submit(get_hosts_file)
+
+    nginx = nginx_f.result()
     if nginx:
         configs["Nginx"] = nginx
 
-    php = get_php_configs()
+    php = php_f.result()
     if php:
         configs["PHP"] = php
 
-    mysql = get_mysql_configs()
+    mysql = mysql_f.result()
     if mysql:
         configs["MySQL/MariaDB"] = mysql
 
-    hosts = get_hosts_file()
+    hosts = hosts_f.result()
     if hosts:
         configs["System"] = [hosts]
 
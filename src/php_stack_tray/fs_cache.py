@@ -0,0 +1,61 @@
+"""TTL-cached filesystem existence checks.
+
+Menu refreshes probe the same candidate paths every few seconds; each
+probe is a stat() syscall. Caching results for a short TTL lets repeated
+refreshes reuse them. Entries expire automatically because the cache key
+includes a monotonic-time bucket.
+"""
+
+import functools
+import os
+import time
+from pathlib import Path
+
+
+# How long a cached result stays valid, in seconds.
+TTL_SECONDS = 2.0
+
+
+@functools.lru_cache(maxsize=256)
+def _exists_cached(path: str, bucket: int) -> bool:
+    return Path(path).exists()
+
+
+@functools.lru_cache(maxsize=256)
+def _is_file_cached(path: str, bucket: int) -> bool:
+    return Path(path).is_file()
+
+
+def path_exists(path: str) -> bool:
+    """Check whether a path exists, caching the result for TTL_SECONDS."""
+    return _exists_cached(str(path), int(time.monotonic() // TTL_SECONDS))
+
+
+@functools.lru_cache(maxsize=128)
+def _list_dir_cached(dirpath: str, bucket: int) -> frozenset:
+    try:
+        with os.scandir(dirpath) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+def dir_names(dirpath: str) -> frozenset:
+    """Names in a directory, cached for TTL_SECONDS.
+
+    Candidate paths sharing a parent directory can be checked against one
+    cached listing instead of stat()ing each path individually.
+    """
+    return _list_dir_cached(str(dirpath), int(time.monotonic() // TTL_SECONDS))
+
+
+def path_is_file(path: str) -> bool:
+    """Check whether a path is a regular file, cached for TTL_SECONDS."""
+    return _is_file_cached(str(path), int(time.monotonic() // TTL_SECONDS))
+
+
+def clear_cache() -> None:
+    """Drop all cached results (e.g., after creating or deleting files)."""
+    _exists_cached.cache_clear()
+    _is_file_cached.cache_clear()
+    _list_dir_cached.cache_clear()
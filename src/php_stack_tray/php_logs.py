@@ -2,12 +2,24 @@
 
 import subprocess
 import re
+from collections import deque
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
-from .systemd_client import is_flatpak
+from .fs_cache import path_exists
+from .systemd_client import is_flatpak, run_host_shell
 
 
+# Precompiled patterns for the hot menu-refresh paths
+_ERRLOG_RE = re.compile(r'error_log\s*=>\s*(\S+)')
+_EQ_PATH_RE = re.compile(r'=\s*(\S+)')
+
+# Lines containing any of these indicate an actual error entry
+_FILTER_RE = re.compile(
+    r'error|fatal|warning|notice|parse|exception|stack trace|php ',
+    re.IGNORECASE
+)
+
 # Common PHP error log locations
 ERROR_LOG_PATHS = [
     "/var/log/php-fpm.log",           # Arch/Fedora/Alpine
@@ -43,7 +55,9 @@ PHP_FPM_CONF_DIRS = [
 def _run_shell(cmd: str) -> tuple[bool, str]:
     """Run a shell command."""
     if is_flatpak():
-        cmd = f"flatpak-spawn --host bash -c '{cmd}'"
+        # Reuse the persistent host shell instead of spawning
+        # flatpak-spawn + bash per call
+        return run_host_shell(cmd)
     try:
         result = subprocess.run(
             cmd,
@@ -57,29 +71,76 @@ def _run_shell(cmd: str) -> tuple[bool, str]:
         return False, str(e)
 
 
+def _run_shell_lines(cmd: str) -> Iterator[str]:
+    """Run a shell command, yielding stdout lines as they arrive.
+
+    Unlike _run_shell this never buffers the whole output in memory, so
+    callers can filter into a bounded window.
+    """
+    if is_flatpak():
+        cmd = f"flatpak-spawn --host bash -c '{cmd}'"
+    try:
+        with subprocess.Popen(
+            cmd,
+            shell=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
+        ) as proc:
+            yield from proc.stdout
+    except Exception:
+        return
+
+
+def _tail_bytes(path: str, lines: int, blocksize: int = 8192) -> Optional[str]:
+    """Read the last N lines of a file by seeking from the end.
+
+    Avoids spawning tail (and the flatpak-spawn round trip) for every log
+    refresh. Returns None if the file cannot be read.
+    """
+    try:
+        with open(path, 'rb') as f:
+            f.seek(0, 2)
+            pos = f.tell()
+            data = b""
+            while pos > 0 and data.count(b"\n") <= lines:
+                step = min(blocksize, pos)
+                pos -= step
+                f.seek(pos)
+                data = f.read(step) + data
+        return b"\n".join(data.splitlines()[-lines:]).decode("utf-8", errors="replace")
+    except OSError:
+        return None
+
+
+# All pool-config globs joined so a single grep covers every location
+_POOL_CONF_GLOBS = " ".join(f"{d}/*.conf" for d in PHP_FPM_CONF_DIRS)
+
+
 def _get_configured_error_log() -> Optional[str]:
     """Get the error_log path from PHP configuration."""
-    # Check php.ini
-    success, output = _run_shell("php -i 2>/dev/null | grep '^error_log' | head -1")
-    if success and output:
-        match = re.search(r'error_log\s*=>\s*(\S+)', output)
-        if match and match.group(1) != "no":
-            path = match.group(1)
-            if Path(path).exists():
-                return path
-
-    # Check php-fpm pool config in multiple locations
-    for conf_dir in PHP_FPM_CONF_DIRS:
-        success, output = _run_shell(
-            f"grep -h 'php_admin_value\\[error_log\\]' {conf_dir}/*.conf 2>/dev/null | "
-            "grep -v '^;' | head -1"
-        )
-        if success and output:
-            match = re.search(r'=\s*(\S+)', output)
-            if match:
-                path = match.group(1)
-                if Path(path).exists():
-                    return path
+    # Run both probes (php.ini and pool configs) in one shell round trip,
+    # emitting labeled lines so Python can tell the results apart.
+    # LC_ALL=C skips per-byte UTF-8 handling in grep (the configs are
+    # ASCII) and -m 1 stops each scan at the first match.
+    success, output = _run_shell(
+        "export LC_ALL=C; "
+        "echo \"PHPI:$(php -i 2>/dev/null | grep -m 1 '^error_log')\"; "
+        f"echo \"POOL:$(grep -h 'php_admin_value\\[error_log\\]' {_POOL_CONF_GLOBS} 2>/dev/null "
+        "| grep -v -m 1 '^;' )\""
+    )
+    if not success or not output:
+        return None
+
+    for line in output.splitlines():
+        if line.startswith("PHPI:"):
+            match = _ERRLOG_RE.search(line)
+            if match and match.group(1) != "no" and path_exists(match.group(1)):
+                return match.group(1)
+        elif line.startswith("POOL:"):
+            match = _EQ_PATH_RE.search(line)
+            if match and path_exists(match.group(1)):
+                return match.group(1)
 
     return None
 
@@ -93,7 +154,7 @@ def _find_error_log() -> Optional[str]:
 
     # Check common locations
     for path in ERROR_LOG_PATHS:
-        if Path(path).exists():
+        if path_exists(path):
             return path
 
     return None
@@ -107,16 +168,24 @@ def get_php_error_log(lines: int = 100) -> tuple[str, str]:
     # Try file-based log first
     log_path = _find_error_log()
     if log_path:
-        success, output = _run_shell(f"tail -n {lines} '{log_path}' 2>/dev/null")
-        if success and output.strip():
+        output = None if is_flatpak() else _tail_bytes(log_path, lines)
+        if output is None:
+            # Sandboxed (or unreadable): let the host shell read it
+            success, output = _run_shell(f"tail -n {lines} '{log_path}' 2>/dev/null")
+            if not success:
+                output = ""
+        if output.strip():
             return output, f"File: {log_path}"
 
-    # Fall back to journalctl - try multiple service names
+    # Fall back to journalctl - try multiple service names, streaming
+    # through a bounded window so large journals never sit in memory
     for service in PHP_FPM_SERVICES:
-        success, output = _run_shell(
-            f"journalctl -u {service} -n {lines} --no-pager 2>/dev/null"
+        tail = deque(
+            _run_shell_lines(f"journalctl -u {service} -n {lines} --no-pager 2>/dev/null"),
+            maxlen=lines
         )
-        if success and output.strip():
+        output = "".join(tail)
+        if output.strip():
             return output, f"Source: journalctl -u {service}"
 
     return "No PHP error logs found.", "No source"
@@ -130,19 +199,14 @@ def get_php_error_log_with_filter(lines: int = 100, filter_errors: bool = True)
     content, source = get_php_error_log(lines * 2)  # Get more lines to filter
 
     if filter_errors and content and "No PHP error logs found" not in content:
-        # Filter for lines containing error indicators
-        error_patterns = [
-            "error", "fatal", "warning", "notice", "parse",
-            "exception", "stack trace", "Error:", "PHP "
-        ]
-        filtered_lines = []
-        for line in content.splitlines():
-            line_lower = line.lower()
-            if any(p in line_lower for p in error_patterns):
-                filtered_lines.append(line)
+        # Filter for lines containing error indicators, keeping only the
+        # last N matches regardless of how much input there is
+        filtered_lines = deque(
+            (line for line in content.splitlines() if _FILTER_RE.search(line)),
+            maxlen=lines
+        )
 
         if filtered_lines:
-            # Return last N lines
-            return "\n".join(filtered_lines[-lines:]), source
+            return "\n".join(filtered_lines), source
 
     return content, source
@@ -1,15 +1,24 @@
 """PHP version switching functionality."""
 
+import functools
+import os
 import subprocess
 import re
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-from .systemd_client import is_flatpak
+from .fs_cache import path_is_file
+from .systemd_client import is_flatpak, run_host_shell
 
 
-@dataclass
+# Precompiled patterns for the hot probe paths
+_PHP_VER_RE = re.compile(r'PHP (\d+\.\d+)')
+_FPM_SVC_RE = re.compile(r'php(\d+)-fpm|php(\d+\.\d+)-fpm|php-fpm')
+
+
+@dataclass(frozen=True, slots=True)
 class PhpVersion:
     """Represents an installed PHP version."""
     version: str  # e.g., "8.2", "8.3"
@@ -37,7 +46,10 @@ def _run_command(cmd: list[str]) -> tuple[bool, str]:
 def _run_shell(cmd: str) -> tuple[bool, str]:
     """Run a shell command."""
     if is_flatpak():
-        cmd = f"flatpak-spawn --host bash -c '{cmd}'"
+        # Reuse the persistent host shell instead of spawning
+        # flatpak-spawn + bash per call
+        success, output = run_host_shell(cmd)
+        return success, output.strip()
     try:
         result = subprocess.run(
             cmd,
@@ -53,66 +65,102 @@ def _run_shell(cmd: str) -> tuple[bool, str]:
 
 def _get_php_version_from_binary(binary_path: str) -> Optional[str]:
     """Extract PHP version from a binary."""
-    success, output = _run_shell(f"{binary_path} -v 2>/dev/null | head -1")
+    # No shell or head needed: the version sits on the first stdout line
+    success, output = _run_command([binary_path, "-v"])
     if success and output:
         # Parse "PHP 8.3.1 (cli) ..." -> "8.3"
-        match = re.search(r'PHP (\d+\.\d+)', output)
+        match = _PHP_VER_RE.search(output.split("\n", 1)[0])
         if match:
             return match.group(1)
     return None
 
 
+# Globs for the default binary plus AUR style (php82) and Debian style (php8.2)
+_PHP_BINARY_GLOBS = "/usr/bin/php /usr/bin/php[0-9][0-9] /usr/bin/php[0-9].[0-9]"
+
+# Matches php, php82 (AUR) and php8.2 (Debian) binary names
+_PHPBIN_RE = re.compile(r'^php(\d\d|\d\.\d)?$')
+
+# Parses one "binary|PHP x.y.z (cli) ..." line from the batched probe
+_PHP_PROBE_RE = re.compile(r'^(\S+)\|PHP (\d+\.\d+)')
+
+
+def _find_php_binaries() -> list[str]:
+    """Discover PHP binaries in /usr/bin with a single directory read."""
+    try:
+        with os.scandir("/usr/bin") as entries:
+            return sorted(e.path for e in entries if _PHPBIN_RE.match(e.name))
+    except OSError:
+        return []
+
+
+# Installed versions only change on package install/removal; cache the
+# full probe for this long so menu repaints don't re-spawn the shell.
+_VERSIONS_TTL_SECONDS = 30.0
+
+
 def get_installed_php_versions() -> list[PhpVersion]:
-    """Detect all installed PHP versions."""
+    """Detect all installed PHP versions (cached for a short TTL)."""
+    return _installed_php_versions(
+        int(time.monotonic() // _VERSIONS_TTL_SECONDS)
+    )
+
+
+def invalidate_version_cache() -> None:
+    """Force the next get_installed_php_versions call to re-probe."""
+    _installed_php_versions.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _installed_php_versions(bucket: int) -> list[PhpVersion]:
     versions = []
     seen_versions = set()
 
-    # Check for default PHP
-    default_version = _get_php_version_from_binary("/usr/bin/php")
-    if default_version:
+    # Discover binaries with one scandir (no subprocess), then probe all
+    # versions in a single shell round trip. Inside Flatpak the sandbox's
+    # /usr/bin is not the host's, so let the host shell glob instead.
+    if is_flatpak():
+        probe_list = _PHP_BINARY_GLOBS
+    else:
+        binaries = _find_php_binaries()
+        if not binaries:
+            return versions
+        probe_list = " ".join(binaries)
+
+    success, output = _run_shell(
+        f'for b in {probe_list}; do '
+        '[ -x "$b" ] || continue; '
+        'v=$("$b" -v 2>/dev/null | head -1); '
+        'echo "$b|$v"; done'
+    )
+    if not success or not output:
+        return versions
+
+    for line in output.splitlines():
+        match = _PHP_PROBE_RE.match(line.strip())
+        if not match:
+            continue
+        binary, version = match.group(1), match.group(2)
+        if version in seen_versions:
+            continue
+
+        binary_name = Path(binary).name
+        if binary_name == "php":
+            fpm_service = "php-fpm"
+        elif "." in binary_name:
+            # Debian/Ubuntu style (php8.2 -> php8.2-fpm)
+            fpm_service = f"php{version}-fpm"
+        else:
+            # Derive service name from binary (php82 -> php82-fpm)
+            fpm_service = f"{binary_name}-fpm"
+
         versions.append(PhpVersion(
-            version=default_version,
-            binary_path="/usr/bin/php",
-            fpm_service="php-fpm",
-            is_default=True
+            version=version,
+            binary_path=binary,
+            fpm_service=fpm_service,
+            is_default=binary_name == "php"
         ))
-        seen_versions.add(default_version)
-
-    # Check for versioned PHP binaries (AUR style: php81, php82, php83)
-    success, output = _run_shell("ls /usr/bin/php[0-9][0-9] 2>/dev/null")
-    if success and output:
-        for binary in output.splitlines():
-            binary = binary.strip()
-            if binary:
-                version = _get_php_version_from_binary(binary)
-                if version and version not in seen_versions:
-                    # Derive service name from binary (php82 -> php82-fpm)
-                    binary_name = Path(binary).name
-                    fpm_service = f"{binary_name}-fpm"
-                    versions.append(PhpVersion(
-                        version=version,
-                        binary_path=binary,
-                        fpm_service=fpm_service,
-                        is_default=False
-                    ))
-                    seen_versions.add(version)
-
-    # Check for Debian/Ubuntu style (/usr/bin/php8.2)
-    success, output = _run_shell("ls /usr/bin/php[0-9].[0-9] 2>/dev/null")
-    if success and output:
-        for binary in output.splitlines():
-            binary = binary.strip()
-            if binary:
-                version = _get_php_version_from_binary(binary)
-                if version and version not in seen_versions:
-                    fpm_service = f"php{version}-fpm"
-                    versions.append(PhpVersion(
-                        version=version,
-                        binary_path=binary,
-                        fpm_service=fpm_service,
-                        is_default=False
-                    ))
-                    seen_versions.add(version)
+        seen_versions.add(version)
 
     return sorted(versions, key=lambda v: v.version, reverse=True)
 
@@ -124,7 +172,7 @@ def get_active_php_version() -> Optional[str]:
     if success and output:
         # Parse service name to get version
         for line in output.splitlines():
-            match = re.search(r'php(\d+)-fpm|php(\d+\.\d+)-fpm|php-fpm', line)
+            match = _FPM_SVC_RE.search(line)
             if match:
                 if match.group(1):
                     # php82-fpm style -> 8.2
@@ -142,10 +190,14 @@ def switch_php_version(target_version: PhpVersion) -> tuple[bool, str]:
     """Switch to a different PHP version by managing FPM services."""
     versions = get_installed_php_versions()
 
-    # Stop all other PHP-FPM services
-    for v in versions:
-        if v.version != target_version.version:
-            _run_command(["pkexec", "systemctl", "stop", v.fpm_service])
+    # Stop all other PHP-FPM services in one systemctl transaction, so
+    # pkexec prompts once instead of once per version
+    to_stop = [
+        v.fpm_service for v in versions
+        if v.version != target_version.version
+    ]
+    if to_stop:
+        _run_command(["pkexec", "systemctl", "stop", *to_stop])
 
     # Start the target PHP-FPM service
     success, output = _run_command(["pkexec", "systemctl", "start", target_version.fpm_service])
@@ -177,8 +229,7 @@ def get_php_ini_path(version: PhpVersion) -> Optional[str]:
     ]
 
     for path in common_paths:
-        success, _ = _run_shell(f"test -f {path}")
-        if success:
+        if path_is_file(path):
             return path
 
     return None
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ServiceDefinition:
     """Definition of a manageable service."""
     name: str  # systemd service name (without .service suffix)
@@ -17,7 +17,7 @@ class ServiceDefinition:
 
 # Default services to manage
 # Note: Order matters - first matching service in a conflict group is shown
-DEFAULT_SERVICES = [
+DEFAULT_SERVICES = (
     ServiceDefinition(
         name="nginx",
         display_name="Nginx",
@@ -63,14 +63,17 @@ DEFAULT_SERVICES = [
         description="PHP FastCGI Process Manager",
         version_cmd="php --version | grep -oP '^PHP \\K[0-9]+\\.[0-9]+'",
     ),
-]
+)
 
 
 class ServiceRegistry:
     """Registry of available services."""
 
     def __init__(self, services: Optional[list[ServiceDefinition]] = None):
-        self._services = {s.name: s for s in (services or DEFAULT_SERVICES)}
+        if services is None:
+            services = DEFAULT_SERVICES
+        self._services = {s.name: s for s in services}
+        self._values: Optional[list[ServiceDefinition]] = None
 
     def get_service(self, name: str) -> Optional[ServiceDefinition]:
         """Get a service definition by name."""
@@ -78,15 +81,19 @@ class ServiceRegistry:
 
     def get_all_services(self) -> list[ServiceDefinition]:
         """Get all registered services."""
-        return list(self._services.values())
+        if self._values is None:
+            self._values = list(self._services.values())
+        return self._values
 
     def add_service(self, service: ServiceDefinition) -> None:
         """Add a new service to the registry."""
         self._services[service.name] = service
+        self._values = None
 
     def remove_service(self, name: str) -> bool:
         """Remove a service from the registry."""
         if name in self._services:
             del self._services[name]
+            self._values = None
             return True
         return False
@@ -1,13 +1,101 @@
 """Systemd service management using pkexec for authentication."""
 
 import os
+import select
 import subprocess
+import threading
+import time
 from enum import Enum
 
+from .fs_cache import path_exists
+
+
+# Sandbox status never changes during the process lifetime; probe once at
+# import instead of stat()ing /.flatpak-info on every subprocess call.
+_IS_FLATPAK = os.path.exists("/.flatpak-info")
+
 
 def is_flatpak() -> bool:
     """Check if running inside a Flatpak sandbox."""
-    return os.path.exists("/.flatpak-info")
+    return _IS_FLATPAK
+
+
+class _HostShell:
+    """Long-lived bash coprocess on the host, for Flatpak sandboxes.
+
+    Every flatpak-spawn --host bash -c invocation costs two extra process
+    spawns. Keeping one host shell alive and writing commands into its
+    stdin amortizes that across all probes. Output is framed with a
+    sentinel line carrying the exit status.
+    """
+
+    _MARKER = "__PST_END__"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._proc: subprocess.Popen | None = None
+
+    def _ensure(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                ["flatpak-spawn", "--host", "bash"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        return self._proc
+
+    def _reset(self) -> None:
+        if self._proc is not None:
+            try:
+                self._proc.kill()
+            except Exception:
+                pass
+            self._proc = None
+
+    def run(self, cmd: str, timeout: float = 10) -> tuple[bool, str]:
+        """Run a command in the host shell, returning (success, stdout)."""
+        with self._lock:
+            try:
+                proc = self._ensure()
+                proc.stdin.write(
+                    (cmd + f"\nprintf '{self._MARKER}:%s\\n' $?\n").encode()
+                )
+                proc.stdin.flush()
+
+                marker = self._MARKER.encode()
+                buf = b""
+                deadline = time.monotonic() + timeout
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(f"host shell timed out: {cmd}")
+                    ready, _, _ = select.select([proc.stdout], [], [], remaining)
+                    if not ready:
+                        continue
+                    chunk = os.read(proc.stdout.fileno(), 65536)
+                    if not chunk:
+                        raise RuntimeError("host shell exited")
+                    buf += chunk
+                    idx = buf.find(marker)
+                    if idx != -1 and b"\n" in buf[idx:]:
+                        status_line = buf[idx:].split(b"\n", 1)[0]
+                        returncode = int(status_line.split(b":", 1)[1])
+                        output = buf[:idx].decode("utf-8", errors="replace")
+                        return returncode == 0, output
+            except Exception as e:
+                # Broken pipe, timeout, garbled framing: drop the shell so
+                # the next call starts a fresh one.
+                self._reset()
+                return False, str(e)
+
+
+_host_shell = _HostShell()
+
+
+def run_host_shell(cmd: str, timeout: float = 10) -> tuple[bool, str]:
+    """Run a shell command on the host via the persistent coprocess."""
+    return _host_shell.run(cmd, timeout)
 
 
 class ServiceState(Enum):
@@ -20,11 +108,28 @@ class ServiceState(Enum):
     UNKNOWN = "unknown"
 
 
+# Precomputed lookup so unknown states don't cost a raised ValueError
+_STATE_MAP = {s.value: s for s in ServiceState}
+
+# Where unit files live; a stat here is far cheaper than systemctl cat
+_SYSTEMD_DIRS = (
+    "/etc/systemd/system",
+    "/usr/lib/systemd/system",
+    "/run/systemd/system",
+    "/lib/systemd/system",
+)
+
+# How long a queried service state stays fresh; absorbs the UI's rapid
+# repaints without hiding real state transitions for long.
+_STATE_TTL_SECONDS = 0.5
+
+
 class SystemdClient:
     """Client for managing systemd services via systemctl + pkexec."""
 
     def __init__(self):
         self._in_flatpak = is_flatpak()
+        self._state_cache: dict[str, tuple[float, ServiceState]] = {}
 
     def _run_command(self, cmd: list[str]) -> tuple[bool, str]:
         """Run a command, using flatpak-spawn if in Flatpak sandbox."""
@@ -48,14 +153,80 @@ class SystemdClient:
         cmd = ["pkexec", "systemctl", *args] if needs_root else ["systemctl", *args]
         return self._run_command(cmd)
 
+    def get_service_states(self, service_names: list[str]) -> dict[str, ServiceState]:
+        """Get the states of several services with one systemctl call.
+
+        Results are cached briefly so rapid UI repaints reuse them.
+        """
+        now = time.monotonic()
+        states: dict[str, ServiceState] = {}
+        missing = []
+        for name in service_names:
+            cached = self._state_cache.get(name)
+            if cached and now - cached[0] < _STATE_TTL_SECONDS:
+                states[name] = cached[1]
+            else:
+                missing.append(name)
+
+        if missing:
+            success, output = self._run_systemctl(
+                "show", "--property=ActiveState",
+                *(f"{name}.service" for name in missing)
+            )
+            values = [
+                line.split("=", 1)[1].strip().lower()
+                for line in output.splitlines()
+                if line.startswith("ActiveState=")
+            ] if success else []
+
+            for name, value in zip(missing, values):
+                state = _STATE_MAP.get(value, ServiceState.UNKNOWN)
+                states[name] = state
+                self._state_cache[name] = (now, state)
+            # Anything systemctl did not report on
+            for name in missing[len(values):]:
+                states[name] = ServiceState.UNKNOWN
+
+        return states
+
     def get_service_state(self, service_name: str) -> ServiceState:
         """Get the current state of a service."""
-        success, output = self._run_systemctl("is-active", f"{service_name}.service")
-        state_str = output.strip().lower()
-        try:
-            return ServiceState(state_str)
-        except ValueError:
-            return ServiceState.UNKNOWN
+        return self.get_service_states([service_name])[service_name]
+
+    def get_bulk_state(self, service_names: list[str]) -> dict[str, tuple[ServiceState, bool]]:
+        """Get (state, enabled-at-boot) for several services in one call.
+
+        systemctl show emits one blank-line-separated property block per
+        unit, in argument order, so a single fork covers the whole
+        refresh tick.
+        """
+        results: dict[str, tuple[ServiceState, bool]] = {}
+        if not service_names:
+            return results
+
+        success, output = self._run_systemctl(
+            "show", "--property=ActiveState", "--property=UnitFileState",
+            *(f"{name}.service" for name in service_names)
+        )
+        blocks = output.strip().split("\n\n") if success else []
+
+        now = time.monotonic()
+        for name, block in zip(service_names, blocks):
+            state = ServiceState.UNKNOWN
+            enabled = False
+            for line in block.splitlines():
+                key, _, value = line.partition("=")
+                if key == "ActiveState":
+                    state = _STATE_MAP.get(value.strip().lower(), ServiceState.UNKNOWN)
+                elif key == "UnitFileState":
+                    enabled = value.strip().lower() == "enabled"
+            results[name] = (state, enabled)
+            self._state_cache[name] = (now, state)
+        # Anything systemctl did not report on
+        for name in service_names[len(blocks):]:
+            results[name] = (ServiceState.UNKNOWN, False)
+
+        return results
 
     def is_service_running(self, service_name: str) -> bool:
         """Check if a service is currently running."""
@@ -84,6 +255,14 @@ class SystemdClient:
 
     def is_service_installed(self, service_name: str) -> bool:
         """Check if a service unit file exists."""
+        # A stat in the unit directories answers the common case without
+        # forking systemctl (inside Flatpak the host dirs aren't mounted,
+        # so this only skips work when it can actually see them)
+        if not self._in_flatpak:
+            for unit_dir in _SYSTEMD_DIRS:
+                if path_exists(f"{unit_dir}/{service_name}.service"):
+                    return True
+        # Fall back for generated/aliased units
         success, output = self._run_systemctl("cat", f"{service_name}.service")
         return success
 
@@ -1,14 +1,18 @@
 """System tray UI for service management."""
 
+import functools
+import os
+import shlex
+import shutil
 import subprocess
 from pathlib import Path
 from typing import Optional
 
-from PyQt6.QtCore import QTimer, Qt
-from PyQt6.QtGui import QAction, QIcon, QPixmap, QPainter, QColor, QBrush
+from PyQt6.QtCore import QTimer, Qt, QObject, QProcess, QRunnable, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QAction, QIcon, QPixmap, QPainter, QColor, QBrush, QFont, QTextOption
 from PyQt6.QtWidgets import (
     QApplication, QMenu, QSystemTrayIcon, QMessageBox,
-    QDialog, QVBoxLayout, QTextEdit, QPushButton, QHBoxLayout,
+    QDialog, QVBoxLayout, QPlainTextEdit, QPushButton, QHBoxLayout,
     QLabel, QLineEdit, QFormLayout, QCheckBox, QFileDialog, QComboBox,
     QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView
 )
@@ -22,32 +26,186 @@ from . import vhosts
 from . import config_files
 
 
+# Pinned probe environment: LC_ALL=C skips locale loading in children,
+# and the explicit utf-8 decode avoids a locale lookup per run() call
+_PROBE_ENV = {**os.environ, "LC_ALL": "C"}
+
+
+@functools.lru_cache(maxsize=32)
+def _theme_icon(name: str) -> QIcon:
+    """QIcon.fromTheme with the XDG theme lookup cached per icon name."""
+    return QIcon.fromTheme(name)
+
+
+@functools.lru_cache(maxsize=1)
+def _tray_pixmap() -> QPixmap:
+    """Draw the blue tray dot once; setup() may run more than once."""
+    pixmap = QPixmap(22, 22)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setBrush(QColor("#3498db"))  # Blue
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.drawEllipse(2, 2, 18, 18)
+    painter.end()
+    return pixmap
+
+
+def _resolve_launcher(*names: Optional[str]) -> Optional[str]:
+    """First resolvable binary from names, as an absolute path."""
+    for name in names:
+        if not name:
+            continue
+        path = shutil.which(name)
+        if path:
+            return path
+    return None
+
+
+def _spawn_detached(argv: list[str]) -> bool:
+    """Spawn a detached child with nulled stdio; True on success.
+
+    close_fds plus DEVNULL stdio keeps our descriptors (Qt sockets, the
+    X11 connection) out of the child, so a chatty viewer can never block
+    on our pipes.
+    """
+    try:
+        subprocess.Popen(
+            argv,
+            start_new_session=True,
+            close_fds=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        return True
+    except Exception:
+        return False
+
+
+def _tail_lines(text: str, n: int) -> str:
+    """Keep only the last n lines of text.
+
+    Trimming in Python before setPlainText keeps the discarded prefix
+    from ever crossing into Qt's text layout. Walks newlines backwards
+    with rfind so a multi-MB fetch is never split into a line list.
+    """
+    end = len(text)
+    if text.endswith("\n"):
+        end -= 1
+    i = end
+    for _ in range(n):
+        j = text.rfind("\n", 0, i)
+        if j == -1:
+            return text
+        i = j
+    return text[i + 1:]
+
+
+class _VersionProbe(QRunnable):
+    """Runs a service version probe off the GUI thread.
+
+    The probe forks a subprocess, so doing it during _build_menu blocks
+    the tray from appearing; instead the menu shows the bare display
+    name and fills the version in when the signal arrives.
+    """
+
+    class Signals(QObject):
+        ready = pyqtSignal(str, object)  # service name, version or None
+
+    def __init__(self, probe_func, service):
+        super().__init__()
+        self._probe_func = probe_func
+        self._service = service
+        self.signals = self.Signals()
+
+    def run(self) -> None:
+        version = self._probe_func(self._service)
+        self.signals.ready.emit(self._service.name, version)
+
+
+class _LogFetchWorker(QRunnable):
+    """Fetches log content off the GUI thread.
+
+    Reading a multi-MB log (or shelling out to the host for it) inside a
+    _view_*_log handler would freeze the tray; the dialog opens at once
+    and the signal fills it in when the fetch lands.
+    """
+
+    class Signals(QObject):
+        ready = pyqtSignal(str, str)  # logs, source
+
+    def __init__(self, fetch_func):
+        super().__init__()
+        self._fetch_func = fetch_func
+        self.signals = self.Signals()
+
+    def run(self) -> None:
+        logs, source = self._fetch_func()
+        self.signals.ready.emit(logs, source)
+
+
+class _VhostPreload(QRunnable):
+    """Warms the vhost scan cache off the GUI thread.
+
+    get_virtual_hosts stamps its result with the sites directories'
+    mtimes, so a background warm-up means the sites dialog opens from
+    cache whenever the directories have not changed since.
+    """
+
+    def run(self) -> None:
+        try:
+            vhosts.get_virtual_hosts()
+        except Exception:
+            pass  # purely a warm-up; the dialog still loads on demand
+
+
 class LogsDialog(QDialog):
     """Dialog to display service logs."""
 
-    def __init__(self, title: str, logs: str, refresh_callback=None, source: str = None, parent=None):
+    # Upper bound on lines kept in the widget; older blocks auto-evict
+    MAX_LOG_BLOCKS = 2000
+
+    def __init__(self, title: str, logs: str = "", fetch=None,
+                 source: str = None, stream_cmd: Optional[list[str]] = None,
+                 parent=None):
+        """fetch, when given, is a callable returning (logs, source); it
+        runs on the thread pool both for the initial load and refresh."""
         super().__init__(parent)
-        self.refresh_callback = refresh_callback
+        self._fetch = fetch
         self.source = source
+        self._last_logs = ""
+        self._stream_cmd = stream_cmd
+        self._proc: Optional[QProcess] = None
+        self._workers = set()  # keep refs until their signal arrives
         self.setWindowTitle(title)
         self.setMinimumSize(700, 500)
         self._setup_ui(logs)
+        if stream_cmd:
+            self._start_stream()
+        elif fetch:
+            self._submit_fetch()
 
     def _setup_ui(self, logs: str) -> None:
         layout = QVBoxLayout(self)
 
-        # Source label (if provided)
-        if self.source:
-            from PyQt6.QtWidgets import QLabel
-            source_label = QLabel(self.source)
-            source_label.setStyleSheet("color: gray; font-size: 11px;")
-            layout.addWidget(source_label)
+        # Source label (if provided or filled in by an async fetch)
+        self.source_label = None
+        if self.source or self._fetch:
+            self.source_label = QLabel(self.source or "")
+            self.source_label.setStyleSheet("color: gray; font-size: 11px;")
+            layout.addWidget(self.source_label)
 
-        # Log text area
-        self.log_text = QTextEdit()
+        # Log text area. QPlainTextEdit is optimized for large plain-text
+        # documents; QTextEdit's rich-text model makes big logs crawl.
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
-        self.log_text.setFontFamily("monospace")
-        self.log_text.setPlainText(logs)
+        self.log_text.setFont(QFont("monospace"))
+        self.log_text.setWordWrapMode(QTextOption.WrapMode.NoWrap)
+        self.log_text.setCenterOnScroll(True)
+        self.log_text.setMaximumBlockCount(self.MAX_LOG_BLOCKS)
+        self.log_text.setPlainText(_tail_lines(logs, self.MAX_LOG_BLOCKS))
+        self._last_logs = logs
         # Scroll to bottom
         self.log_text.moveCursor(self.log_text.textCursor().MoveOperation.End)
         layout.addWidget(self.log_text)
@@ -67,23 +225,78 @@ class LogsDialog(QDialog):
 
         layout.addLayout(button_layout)
 
+    def _start_stream(self) -> None:
+        """Launch the log command and stream its output into the view.
+
+        The dialog stays responsive while journalctl runs, instead of
+        blocking on the full fetch before it can even open.
+        """
+        self.log_text.clear()
+        self._proc = QProcess(self)
+        self._proc.readyReadStandardOutput.connect(self._on_stream_output)
+        self._proc.start(self._stream_cmd[0], self._stream_cmd[1:])
+
+    def _on_stream_output(self) -> None:
+        data = bytes(self._proc.readAllStandardOutput()).decode("utf-8", "replace")
+        if data:
+            # insertPlainText keeps chunk boundaries mid-line intact
+            self.log_text.moveCursor(self.log_text.textCursor().MoveOperation.End)
+            self.log_text.insertPlainText(data)
+            self.log_text.moveCursor(self.log_text.textCursor().MoveOperation.End)
+
+    def _submit_fetch(self) -> None:
+        """Fetch the logs on the thread pool and apply them on arrival."""
+        worker = _LogFetchWorker(self._fetch)
+        self._workers.add(worker)
+        worker.signals.ready.connect(
+            lambda logs, source, w=worker: self._on_fetch_ready(logs, source, w)
+        )
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_fetch_ready(self, logs: str, source: str, worker) -> None:
+        self._workers.discard(worker)
+        self.set_logs(logs)
+        if self.source_label is not None and source:
+            self.source_label.setText(source)
+
+    def set_logs(self, logs: str) -> None:
+        """Replace the displayed logs, appending only the delta when the
+        new fetch extends the old one; the block cap evicts stale lines
+        from the top."""
+        if self._last_logs and logs.startswith(self._last_logs):
+            delta = logs[len(self._last_logs):]
+            if delta:
+                self.log_text.appendPlainText(delta.strip("\n"))
+        else:
+            self.log_text.setPlainText(_tail_lines(logs, self.MAX_LOG_BLOCKS))
+        self._last_logs = logs
+        self.log_text.moveCursor(self.log_text.textCursor().MoveOperation.End)
+
     def _on_refresh(self) -> None:
         """Refresh the logs."""
-        if self.refresh_callback:
-            logs = self.refresh_callback()
-            self.log_text.setPlainText(logs)
-            self.log_text.moveCursor(self.log_text.textCursor().MoveOperation.End)
+        if self._stream_cmd:
+            self._proc.kill()
+            self._proc.waitForFinished(1000)
+            self._start_stream()
+            return
+        if self._fetch:
+            self._submit_fetch()
 
 
 class UnifiedLogsDialog(QDialog):
     """Dialog to display logs with a dropdown selector."""
 
+    # Upper bound on lines kept in the widget; older blocks auto-evict
+    MAX_LOG_BLOCKS = 2000
+
     def __init__(self, log_sources: dict, parent=None):
         """
         log_sources: dict of {display_name: (fetch_function, source_label)}
         """
         super().__init__(parent)
         self.log_sources = log_sources
+        self._last_logs: dict[str, str] = {}  # per-selector, for delta appends
+        self._loaded_source: Optional[str] = None
         self.setWindowTitle("Logs Viewer")
         self.setMinimumSize(800, 600)
         self._setup_ui()
@@ -102,7 +315,7 @@ class UnifiedLogsDialog(QDialog):
         top_layout.addWidget(self.log_selector, 1)
 
         refresh_btn = QPushButton("Refresh")
-        refresh_btn.setIcon(QIcon.fromTheme("view-refresh"))
+        refresh_btn.setIcon(_theme_icon("view-refresh"))
         refresh_btn.clicked.connect(self._on_refresh)
         top_layout.addWidget(refresh_btn)
 
@@ -113,10 +326,13 @@ class UnifiedLogsDialog(QDialog):
         self.source_label.setStyleSheet("color: gray; font-size: 11px;")
         layout.addWidget(self.source_label)
 
-        # Log text area
-        self.log_text = QTextEdit()
+        # Log text area (QPlainTextEdit: see LogsDialog)
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
-        self.log_text.setFontFamily("monospace")
+        self.log_text.setFont(QFont("monospace"))
+        self.log_text.setWordWrapMode(QTextOption.WrapMode.NoWrap)
+        self.log_text.setCenterOnScroll(True)
+        self.log_text.setMaximumBlockCount(self.MAX_LOG_BLOCKS)
         layout.addWidget(self.log_text)
 
         # Bottom buttons
@@ -147,11 +363,23 @@ class UnifiedLogsDialog(QDialog):
             fetch_func, source = self.log_sources[current]
             try:
                 logs = fetch_func()
-                self.log_text.setPlainText(logs)
+                # Refreshing the log already on screen only appends the
+                # delta; switching sources rebuilds the document.
+                prev = self._last_logs.get(current, "")
+                if (current == self._loaded_source and prev
+                        and logs.startswith(prev)):
+                    delta = logs[len(prev):]
+                    if delta:
+                        self.log_text.appendPlainText(delta.strip("\n"))
+                else:
+                    self.log_text.setPlainText(_tail_lines(logs, self.MAX_LOG_BLOCKS))
+                self._last_logs[current] = logs
+                self._loaded_source = current
                 self.log_text.moveCursor(self.log_text.textCursor().MoveOperation.End)
                 self.source_label.setText(source)
             except Exception as e:
                 self.log_text.setPlainText(f"Error loading log: {e}")
+                self._loaded_source = None
                 self.source_label.setText("")
 
 
@@ -174,7 +402,11 @@ class NewVhostDialog(QDialog):
 
         self.name_input = QLineEdit()
         self.name_input.setPlaceholderText("myproject")
-        self.name_input.textChanged.connect(self._update_server_name)
+        # editingFinished instead of textChanged: fill the domain once
+        # when the user leaves the field, not on every keystroke
+        self.name_input.editingFinished.connect(
+            lambda: self._update_server_name(self.name_input.text())
+        )
         form.addRow("Config name:", self.name_input)
 
         self.server_name_input = QLineEdit()
@@ -272,6 +504,10 @@ class NewVhostDialog(QDialog):
 class SitesDialog(QDialog):
     """Dialog for managing virtual hosts / sites."""
 
+    # Status colors, built once instead of per row
+    ENABLED_COLOR = QColor("#2ecc71")
+    DISABLED_COLOR = QColor("#95a5a6")
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Sites Manager")
@@ -309,31 +545,31 @@ class SitesDialog(QDialog):
         action_layout = QHBoxLayout()
 
         self.toggle_btn = QPushButton("Enable")
-        self.toggle_btn.setIcon(QIcon.fromTheme("media-playback-start"))
+        self.toggle_btn.setIcon(_theme_icon("media-playback-start"))
         self.toggle_btn.clicked.connect(self._toggle_site)
         self.toggle_btn.setEnabled(False)
         action_layout.addWidget(self.toggle_btn)
 
         self.php_btn = QPushButton("Change PHP")
-        self.php_btn.setIcon(QIcon.fromTheme("applications-development"))
+        self.php_btn.setIcon(_theme_icon("applications-development"))
         self.php_btn.clicked.connect(self._change_php_version)
         self.php_btn.setEnabled(False)
         action_layout.addWidget(self.php_btn)
 
         self.browser_btn = QPushButton("Open in Browser")
-        self.browser_btn.setIcon(QIcon.fromTheme("internet-web-browser"))
+        self.browser_btn.setIcon(_theme_icon("internet-web-browser"))
         self.browser_btn.clicked.connect(self._open_in_browser)
         self.browser_btn.setEnabled(False)
         action_layout.addWidget(self.browser_btn)
 
         self.edit_btn = QPushButton("Edit Config")
-        self.edit_btn.setIcon(QIcon.fromTheme("document-edit"))
+        self.edit_btn.setIcon(_theme_icon("document-edit"))
         self.edit_btn.clicked.connect(self._edit_config)
         self.edit_btn.setEnabled(False)
         action_layout.addWidget(self.edit_btn)
 
         self.delete_btn = QPushButton("Delete")
-        self.delete_btn.setIcon(QIcon.fromTheme("edit-delete"))
+        self.delete_btn.setIcon(_theme_icon("edit-delete"))
         self.delete_btn.clicked.connect(self._delete_site)
         self.delete_btn.setEnabled(False)
         action_layout.addWidget(self.delete_btn)
@@ -344,12 +580,12 @@ class SitesDialog(QDialog):
         bottom_layout = QHBoxLayout()
 
         new_btn = QPushButton("New Site...")
-        new_btn.setIcon(QIcon.fromTheme("list-add"))
+        new_btn.setIcon(_theme_icon("list-add"))
         new_btn.clicked.connect(self._new_site)
         bottom_layout.addWidget(new_btn)
 
         refresh_btn = QPushButton("Refresh")
-        refresh_btn.setIcon(QIcon.fromTheme("view-refresh"))
+        refresh_btn.setIcon(_theme_icon("view-refresh"))
         refresh_btn.clicked.connect(self._load_sites)
         bottom_layout.addWidget(refresh_btn)
 
@@ -363,21 +599,26 @@ class SitesDialog(QDialog):
 
     def _load_sites(self) -> None:
         """Load and display all virtual hosts."""
-        self.table.setRowCount(0)
         self._sites = vhosts.get_virtual_hosts()
 
-        for vh in self._sites:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-
-            self.table.setItem(row, 0, QTableWidgetItem(vh.name))
-            self.table.setItem(row, 1, QTableWidgetItem(vh.server_name or "-"))
-            self.table.setItem(row, 2, QTableWidgetItem(vh.document_root or "-"))
-            self.table.setItem(row, 3, QTableWidgetItem(vh.php_version))
-
-            status_item = QTableWidgetItem("Enabled" if vh.enabled else "Disabled")
-            status_item.setForeground(QColor("#2ecc71" if vh.enabled else "#95a5a6"))
-            self.table.setItem(row, 4, status_item)
+        # Fill with updates suspended and the row count preallocated, so
+        # the table lays out once instead of once per inserted row
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.table.setRowCount(len(self._sites))
+            for row, vh in enumerate(self._sites):
+                self.table.setItem(row, 0, QTableWidgetItem(vh.name))
+                self.table.setItem(row, 1, QTableWidgetItem(vh.server_name or "-"))
+                self.table.setItem(row, 2, QTableWidgetItem(vh.document_root or "-"))
+                self.table.setItem(row, 3, QTableWidgetItem(vh.php_version))
+
+                status_item = QTableWidgetItem("Enabled" if vh.enabled else "Disabled")
+                status_item.setForeground(
+                    self.ENABLED_COLOR if vh.enabled else self.DISABLED_COLOR
+                )
+                self.table.setItem(row, 4, status_item)
+        finally:
+            self.table.setUpdatesEnabled(True)
 
         self._on_selection_changed()
 
@@ -406,10 +647,10 @@ class SitesDialog(QDialog):
         if site:
             if site.enabled:
                 self.toggle_btn.setText("Disable")
-                self.toggle_btn.setIcon(QIcon.fromTheme("media-playback-stop"))
+                self.toggle_btn.setIcon(_theme_icon("media-playback-stop"))
             else:
                 self.toggle_btn.setText("Enable")
-                self.toggle_btn.setIcon(QIcon.fromTheme("media-playback-start"))
+                self.toggle_btn.setIcon(_theme_icon("media-playback-start"))
 
     def _toggle_site(self) -> None:
         """Enable or disable the selected site."""
@@ -431,13 +672,13 @@ class SitesDialog(QDialog):
         site = self._get_selected_site()
         if site and site.server_name:
             url = f"http://{site.server_name}"
-            subprocess.Popen(["xdg-open", url], start_new_session=True)
+            _spawn_detached(["xdg-open", url])
 
     def _edit_config(self) -> None:
         """Open the config file in default editor."""
         site = self._get_selected_site()
         if site:
-            subprocess.Popen(["xdg-open", str(site.config_path)], start_new_session=True)
+            _spawn_detached(["xdg-open", str(site.config_path)])
 
     def _delete_site(self) -> None:
         """Delete the selected site."""
@@ -462,18 +703,18 @@ class SitesDialog(QDialog):
         dialog = NewVhostDialog(self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             data = dialog.result_data
+            # One call, one polkit prompt: the hosts entry and enable
+            # steps ride in the same elevated shell as the config write
             success, message = vhosts.create_vhost(
                 data["name"],
                 data["server_name"],
                 data["docroot"],
-                data["php_socket"]
+                data["php_socket"],
+                add_hosts=data["add_hosts"],
+                enable=data["enable"]
             )
 
             if success:
-                if data["add_hosts"]:
-                    vhosts.add_hosts_entry(data["server_name"])
-                if data["enable"]:
-                    vhosts.enable_vhost(data["name"])
                 self._load_sites()
             else:
                 QMessageBox.warning(self, "Error", message)
@@ -539,6 +780,7 @@ class PHPStackTray:
     """System tray application for PHP development."""
 
     REFRESH_INTERVAL_MS = 5000  # 5 seconds
+    VHOST_WARM_INTERVAL_MS = 30000  # background vhost-cache rewarm
 
     # Status indicator colors
     STATUS_COLORS = {
@@ -550,8 +792,19 @@ class PHPStackTray:
         ServiceState.UNKNOWN: "#95a5a6",     # Gray
     }
 
+    # Human-readable status labels
+    STATUS_TEXT = {
+        ServiceState.ACTIVE: "Running",
+        ServiceState.INACTIVE: "Stopped",
+        ServiceState.FAILED: "Failed",
+        ServiceState.ACTIVATING: "Starting...",
+        ServiceState.DEACTIVATING: "Stopping...",
+        ServiceState.UNKNOWN: "Unknown",
+    }
+
     def __init__(self, app: QApplication):
         self._app = app
+        self._is_flatpak = is_flatpak()  # never changes during the process
         self._systemd = SystemdClient()
         self._registry = ServiceRegistry()
         self._tray: Optional[QSystemTrayIcon] = None
@@ -559,10 +812,27 @@ class PHPStackTray:
         self._service_menus: dict[str, QMenu] = {}
         self._status_actions: dict[str, QAction] = {}
         self._service_actions: dict[str, dict[str, QAction]] = {}  # service -> {start, stop, restart}
+        self._refresh_records: list[tuple[str, QAction, QMenu, dict]] = []
+        self._status_icons: dict[ServiceState, QIcon] = {}
         self._refresh_timer: Optional[QTimer] = None
+        self._vhost_warm_timer: Optional[QTimer] = None
+        self._refresh_pending = False
+        self._status_dirty = True
+        self._pending_updates: set[str] = set()
+        self._version_cache: dict[str, Optional[str]] = {}
+        self._version_probes: set[_VersionProbe] = set()  # keep signal owners alive
         self._xdebug_action: Optional[QAction] = None
         self._php_version_menu: Optional[QMenu] = None
         self._php_version_actions: dict[str, QAction] = {}
+        self._populated_menus: set[int] = set()  # lazily built submenus
+        # PATH lookups done once at startup; every click after that is a
+        # single fork of an already-resolved binary
+        self._xdg_open = _resolve_launcher("xdg-open")
+        self._editor = _resolve_launcher(
+            os.environ.get("EDITOR"), os.environ.get("VISUAL"),
+            "xdg-open", "kate", "gedit", "mousepad", "featherpad",
+            "pluma", "xed", "code",
+        )
 
     def setup(self) -> bool:
         """Initialize the system tray icon and menu."""
@@ -576,29 +846,36 @@ class PHPStackTray:
 
         self._tray = QSystemTrayIcon()
 
-        # Create a simple colored icon that always works
-        from PyQt6.QtGui import QPixmap, QPainter, QColor
-        from PyQt6.QtCore import Qt
-        pixmap = QPixmap(22, 22)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setBrush(QColor("#3498db"))  # Blue
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawEllipse(2, 2, 18, 18)
-        painter.end()
-
-        self._tray.setIcon(QIcon(pixmap))
+        # Simple colored icon that always works
+        self._tray.setIcon(QIcon(_tray_pixmap()))
         self._tray.setToolTip("PHP Stack Tray")
 
+        # Render the six status dots once; refresh ticks just look them up
+        self._status_icons = {
+            state: self._create_status_icon(state) for state in ServiceState
+        }
+
         self._build_menu()
         self._tray.setContextMenu(self._menu)
 
+        # Refresh right before the menu is shown; the periodic timer
+        # only marks state dirty while nobody is looking
+        self._menu.aboutToShow.connect(self._on_menu_about_to_show)
+
         # Setup refresh timer
         self._refresh_timer = QTimer()
-        self._refresh_timer.timeout.connect(self._refresh_status)
+        self._refresh_timer.timeout.connect(self._on_timer_tick)
         self._refresh_timer.start(self.REFRESH_INTERVAL_MS)
 
+        # Warm the vhost scan off-thread now and on a coarse interval,
+        # so opening the sites dialog never pays the first full walk
+        QThreadPool.globalInstance().start(_VhostPreload())
+        self._vhost_warm_timer = QTimer()
+        self._vhost_warm_timer.timeout.connect(
+            lambda: QThreadPool.globalInstance().start(_VhostPreload())
+        )
+        self._vhost_warm_timer.start(self.VHOST_WARM_INTERVAL_MS)
+
         self._tray.setVisible(True)
         self._tray.show()
         return True
@@ -606,6 +883,7 @@ class PHPStackTray:
     def _build_menu(self) -> None:
         """Build the context menu with all services."""
         self._menu = QMenu()
+        self._populated_menus.clear()  # fresh QMenu objects on rebuild
 
         # === HEADER ===
         header = QAction("PHP Stack Tray", self._menu)
@@ -638,7 +916,7 @@ class PHPStackTray:
         # === SITES (right after services) ===
         if vhosts.has_nginx_sites():
             self._menu.addSeparator()
-            sites_action = QAction(QIcon.fromTheme("network-server"), "Sites...", self._menu)
+            sites_action = QAction(_theme_icon("network-server"), "Sites...", self._menu)
             sites_action.triggered.connect(self._show_sites_dialog)
             self._menu.addAction(sites_action)
 
@@ -650,13 +928,18 @@ class PHPStackTray:
             self._menu.addSeparator()
 
         if versions:
+            # The heavy probes (active version subprocess, php.ini stat
+            # per version) run on the first aboutToShow, not at startup
             self._php_version_menu = QMenu("PHP Version", self._menu)
-            self._php_version_menu.setIcon(QIcon.fromTheme("applications-development"))
-            self._build_php_version_menu(versions)
+            self._php_version_menu.setIcon(_theme_icon("applications-development"))
+            self._php_version_menu.aboutToShow.connect(
+                lambda m=self._php_version_menu, v=versions:
+                    self._populate_once(m, lambda: self._build_php_version_menu(v))
+            )
             self._menu.addMenu(self._php_version_menu)
 
         if xdebug.is_xdebug_installed():
-            self._xdebug_action = QAction(QIcon.fromTheme("debug-run"), "Xdebug: ...", self._menu)
+            self._xdebug_action = QAction(_theme_icon("debug-run"), "Xdebug: ...", self._menu)
             self._xdebug_action.triggered.connect(self._toggle_xdebug)
             self._menu.addAction(self._xdebug_action)
             self._update_xdebug_status()
@@ -664,49 +947,121 @@ class PHPStackTray:
         # === DIAGNOSTICS (logs + config together) ===
         self._menu.addSeparator()
 
-        view_logs_action = QAction(QIcon.fromTheme("text-x-log"), "View Logs", self._menu)
+        view_logs_action = QAction(_theme_icon("text-x-log"), "View Logs", self._menu)
         view_logs_action.triggered.connect(self._view_all_logs)
         self._menu.addAction(view_logs_action)
 
         all_configs = config_files.get_all_configs()
         if all_configs:
             config_menu = QMenu("Config Files", self._menu)
-            config_menu.setIcon(QIcon.fromTheme("preferences-system"))
-            self._build_config_menu(config_menu, all_configs)
+            config_menu.setIcon(_theme_icon("preferences-system"))
+            config_menu.aboutToShow.connect(
+                lambda m=config_menu, c=all_configs:
+                    self._populate_once(m, lambda: self._build_config_menu(m, c))
+            )
             self._menu.addMenu(config_menu)
 
         # === SYSTEM ===
         self._menu.addSeparator()
 
-        refresh_action = QAction(QIcon.fromTheme("view-refresh"), "Refresh Status", self._menu)
-        refresh_action.triggered.connect(self._refresh_status)
+        refresh_action = QAction(_theme_icon("view-refresh"), "Refresh Status", self._menu)
+        refresh_action.triggered.connect(self._request_refresh)
         self._menu.addAction(refresh_action)
 
         self._menu.addSeparator()
 
-        about_action = QAction(QIcon.fromTheme("help-about"), "About", self._menu)
+        about_action = QAction(_theme_icon("help-about"), "About", self._menu)
         about_action.triggered.connect(self._show_about)
         self._menu.addAction(about_action)
 
-        quit_action = QAction(QIcon.fromTheme("application-exit"), "Quit", self._menu)
+        quit_action = QAction(_theme_icon("application-exit"), "Quit", self._menu)
         quit_action.triggered.connect(self._quit)
         self._menu.addAction(quit_action)
 
+        # Flat records so refresh ticks skip the per-service dict lookups
+        self._refresh_records = [
+            (
+                name,
+                self._status_actions[name],
+                self._service_menus[name],
+                self._service_actions[name],
+            )
+            for name in self._status_actions
+        ]
+
+    def _populate_once(self, menu: QMenu, builder) -> None:
+        """Run a submenu builder the first time the menu is shown."""
+        key = id(menu)
+        if key in self._populated_menus:
+            return
+        self._populated_menus.add(key)
+        builder()
+
     def _get_service_version(self, service: ServiceDefinition) -> Optional[str]:
-        """Get version string for a service."""
+        """Get version string for a service (cached; versions only change
+        on package upgrades or a PHP version switch)."""
         if not service.version_cmd:
             return None
+        if service.name in self._version_cache:
+            return self._version_cache[service.name]
+        version = self._probe_service_version(service)
+        self._version_cache[service.name] = version
+        return version
+
+    def _probe_version_async(self, service: ServiceDefinition) -> None:
+        """Probe a service version on the global thread pool."""
+        probe = _VersionProbe(self._probe_service_version, service)
+        probe.signals.ready.connect(self._on_version_ready)
+        self._version_probes.add(probe)
+        QThreadPool.globalInstance().start(probe)
+
+    def _on_version_ready(self, service_name: str, version: Optional[str]) -> None:
+        """Fill the probed version into the service menu title."""
+        self._version_cache[service_name] = version
+        self._version_probes = {
+            p for p in self._version_probes if p._service.name != service_name
+        }
+        if version and service_name in self._service_menus:
+            service = self._registry.get_service(service_name)
+            if service:
+                self._service_menus[service_name].setTitle(
+                    f"{service.display_name} {version}"
+                )
+
+    # version_cmds containing any of these need a real shell (pipelines)
+    _SHELL_META = frozenset("|&;<>()$`\"'*?[]{}~\\")
+
+    def _probe_service_version(self, service: ServiceDefinition) -> Optional[str]:
         try:
             cmd = service.version_cmd
-            if is_flatpak():
-                cmd = f"flatpak-spawn --host bash -c '{cmd}'"
-            result = subprocess.run(
-                cmd,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            if any(c in self._SHELL_META for c in cmd):
+                # Pipeline or expansion: keep the shell
+                if self._is_flatpak:
+                    cmd = f"flatpak-spawn --host bash -c '{cmd}'"
+                result = subprocess.run(
+                    cmd,
+                    shell=True,
+                    capture_output=True,
+                    text=True,
+                    encoding="utf-8",
+                    errors="replace",
+                    env=_PROBE_ENV,
+                    timeout=5
+                )
+            else:
+                # Plain argv: skip the /bin/sh fork entirely
+                argv = shlex.split(cmd)
+                if self._is_flatpak:
+                    argv = ["flatpak-spawn", "--host", *argv]
+                result = subprocess.run(
+                    argv,
+                    capture_output=True,
+                    text=True,
+                    encoding="utf-8",
+                    errors="replace",
+                    env=_PROBE_ENV,
+                    timeout=5
+                )
             version = result.stdout.strip()
             return version if version else None
         except Exception:
@@ -714,11 +1069,16 @@ class PHPStackTray:
 
     def _add_service_menu(self, service: ServiceDefinition) -> None:
         """Add a submenu for a specific service."""
-        # Build display name with version
+        # Build display name with version. Unknown versions are probed
+        # off-thread and the title patched in when the result arrives,
+        # so the menu never waits on a subprocess.
         display_name = service.display_name
-        version = self._get_service_version(service)
-        if version:
-            display_name = f"{service.display_name} {version}"
+        if service.name in self._version_cache:
+            version = self._version_cache[service.name]
+            if version:
+                display_name = f"{service.display_name} {version}"
+        elif service.version_cmd:
+            self._probe_version_async(service)
 
         service_menu = QMenu(display_name, self._menu)
         self._service_menus[service.name] = service_menu
@@ -732,29 +1092,29 @@ class PHPStackTray:
         service_menu.addSeparator()
 
         # Start action
-        start_action = QAction(QIcon.fromTheme("media-playback-start"), "Start", service_menu)
+        start_action = QAction(_theme_icon("media-playback-start"), "Start", service_menu)
         start_action.triggered.connect(lambda: self._start_service(service.name))
         service_menu.addAction(start_action)
 
         # Stop action
-        stop_action = QAction(QIcon.fromTheme("media-playback-stop"), "Stop", service_menu)
+        stop_action = QAction(_theme_icon("media-playback-stop"), "Stop", service_menu)
         stop_action.triggered.connect(lambda: self._stop_service(service.name))
         service_menu.addAction(stop_action)
 
         # Restart action
-        restart_action = QAction(QIcon.fromTheme("view-refresh"), "Restart", service_menu)
+        restart_action = QAction(_theme_icon("view-refresh"), "Restart", service_menu)
         restart_action.triggered.connect(lambda: self._restart_service(service.name))
         service_menu.addAction(restart_action)
 
         service_menu.addSeparator()
 
         # View Logs action
-        logs_action = QAction(QIcon.fromTheme("text-x-log"), "View Logs", service_menu)
+        logs_action = QAction(_theme_icon("text-x-log"), "View Logs", service_menu)
         logs_action.triggered.connect(lambda: self._view_logs(service.name))
         service_menu.addAction(logs_action)
 
         # Autostart toggle action
-        autostart_action = QAction(QIcon.fromTheme("system-run"), "Autostart: ...", service_menu)
+        autostart_action = QAction(_theme_icon("system-run"), "Autostart: ...", service_menu)
         autostart_action.triggered.connect(lambda: self._toggle_autostart(service.name))
         service_menu.addAction(autostart_action)
 
@@ -790,15 +1150,7 @@ class PHPStackTray:
 
     def _get_status_text(self, state: ServiceState) -> str:
         """Get human-readable status text."""
-        status_map = {
-            ServiceState.ACTIVE: "Running",
-            ServiceState.INACTIVE: "Stopped",
-            ServiceState.FAILED: "Failed",
-            ServiceState.ACTIVATING: "Starting...",
-            ServiceState.DEACTIVATING: "Stopping...",
-            ServiceState.UNKNOWN: "Unknown",
-        }
-        return status_map.get(state, "Unknown")
+        return self.STATUS_TEXT.get(state, "Unknown")
 
     def _update_service_status(self, service_name: str) -> None:
         """Update the status display and action visibility for a service."""
@@ -806,32 +1158,80 @@ class PHPStackTray:
             return
 
         state = self._systemd.get_service_state(service_name)
-        status_text = self._get_status_text(state)
-        self._status_actions[service_name].setText(f"Status: {status_text}")
+        is_enabled = self._systemd.is_service_enabled(service_name)
+        self._apply_service_status(service_name, state, is_enabled)
+
+    def _apply_service_status(self, service_name: str, state: ServiceState,
+                              is_enabled: bool) -> None:
+        """Apply an already-known state to the service's menu entries."""
+        self._apply_status_record(
+            self._status_actions[service_name],
+            self._service_menus[service_name],
+            self._service_actions[service_name],
+            state,
+            is_enabled,
+        )
+
+    def _apply_status_record(self, status_action: QAction, menu: QMenu,
+                             actions: dict, state: ServiceState,
+                             is_enabled: bool) -> None:
+        """Update menu entries from pre-bound references (no dict hops)."""
+        status_action.setText(f"Status: {self._get_status_text(state)}")
 
         # Update service menu icon with status indicator
-        if service_name in self._service_menus:
-            status_icon = self._create_status_icon(state)
-            self._service_menus[service_name].setIcon(status_icon)
+        menu.setIcon(self._status_icons[state])
 
         # Update action visibility based on state
-        if service_name in self._service_actions:
-            actions = self._service_actions[service_name]
-            is_running = state == ServiceState.ACTIVE
-            actions["start"].setVisible(not is_running)
-            actions["stop"].setVisible(is_running)
-            actions["restart"].setVisible(is_running)
-
-            # Update autostart status
-            if "autostart" in actions:
-                is_enabled = self._systemd.is_service_enabled(service_name)
-                autostart_text = "Enabled" if is_enabled else "Disabled"
-                actions["autostart"].setText(f"Autostart: {autostart_text}")
+        is_running = state == ServiceState.ACTIVE
+        actions["start"].setVisible(not is_running)
+        actions["stop"].setVisible(is_running)
+        actions["restart"].setVisible(is_running)
+
+        # Update autostart status
+        autostart_text = "Enabled" if is_enabled else "Disabled"
+        actions["autostart"].setText(f"Autostart: {autostart_text}")
+
+    def _on_timer_tick(self) -> None:
+        """Periodic tick: skip the subprocess work while the menu is
+        closed, since nothing it updates is visible."""
+        if self._menu and self._menu.isVisible():
+            self._request_refresh()
+        else:
+            self._status_dirty = True
+
+    def _on_menu_about_to_show(self) -> None:
+        """Bring statuses up to date just before the user sees them."""
+        if self._status_dirty:
+            self._status_dirty = False
+            self._refresh_status()
+
+    def _request_refresh(self) -> None:
+        """Schedule a status refresh, coalescing rapid requests.
+
+        Timer ticks, the Refresh Status action and post-toggle updates
+        can all fire close together; only one refresh runs per 500 ms.
+        """
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        QTimer.singleShot(500, self._do_refresh)
+
+    def _do_refresh(self) -> None:
+        self._refresh_pending = False
+        self._refresh_status()
 
     def _refresh_status(self) -> None:
         """Refresh status of all services."""
-        for service_name in self._status_actions:
-            self._update_service_status(service_name)
+        # One systemctl show covers every service instead of two forks
+        # per service per tick
+        if self._refresh_records:
+            bulk = self._systemd.get_bulk_state(
+                [record[0] for record in self._refresh_records]
+            )
+            for name, status_action, menu, actions in self._refresh_records:
+                state, is_enabled = bulk[name]
+                self._apply_status_record(status_action, menu, actions,
+                                          state, is_enabled)
         self._update_xdebug_status()
 
     def _start_service(self, service_name: str) -> None:
@@ -841,7 +1241,7 @@ class PHPStackTray:
         else:
             self._show_notification(f"Failed to start {service_name}", error=True)
         # Refresh after a short delay to show new status
-        QTimer.singleShot(1000, lambda: self._update_service_status(service_name))
+        self._schedule_update(service_name)
 
     def _stop_service(self, service_name: str) -> None:
         """Stop a service."""
@@ -849,7 +1249,7 @@ class PHPStackTray:
             self._show_notification(f"Stopping {service_name}...")
         else:
             self._show_notification(f"Failed to stop {service_name}", error=True)
-        QTimer.singleShot(1000, lambda: self._update_service_status(service_name))
+        self._schedule_update(service_name)
 
     def _restart_service(self, service_name: str) -> None:
         """Restart a service."""
@@ -857,7 +1257,20 @@ class PHPStackTray:
             self._show_notification(f"Restarting {service_name}...")
         else:
             self._show_notification(f"Failed to restart {service_name}", error=True)
-        QTimer.singleShot(1000, lambda: self._update_service_status(service_name))
+        self._schedule_update(service_name)
+
+    def _schedule_update(self, service_name: str) -> None:
+        """Schedule a delayed single-service status update, at most one
+        pending per service however many times its actions are clicked."""
+        if service_name in self._pending_updates:
+            return
+        self._pending_updates.add(service_name)
+
+        def fire() -> None:
+            self._pending_updates.discard(service_name)
+            self._update_service_status(service_name)
+
+        QTimer.singleShot(1000, fire)
 
     def _toggle_autostart(self, service_name: str) -> None:
         """Toggle autostart for a service."""
@@ -878,45 +1291,42 @@ class PHPStackTray:
 
     def _view_logs(self, service_name: str) -> None:
         """Show logs dialog for a service."""
-        logs = self._systemd.get_logs(service_name)
+        # Stream journalctl via QProcess so the dialog opens immediately
+        # instead of blocking on the full fetch
+        cmd = [
+            "journalctl", "-u", f"{service_name}.service",
+            "-n", str(LogsDialog.MAX_LOG_BLOCKS), "--no-pager",
+        ]
+        if self._is_flatpak:
+            cmd = ["flatpak-spawn", "--host", *cmd]
         dialog = LogsDialog(
             f"Logs - {service_name}",
-            logs,
-            refresh_callback=lambda: self._systemd.get_logs(service_name),
+            stream_cmd=cmd,
             source=f"journalctl -u {service_name}.service"
         )
         dialog.exec()
 
     def _view_nginx_access_log(self) -> None:
         """Show nginx access log dialog."""
-        logs, source = web_logs.get_nginx_access_log(lines=100)
         dialog = LogsDialog(
             "Nginx Access Log",
-            logs,
-            refresh_callback=lambda: web_logs.get_nginx_access_log(lines=100)[0],
-            source=source
+            fetch=lambda: web_logs.get_nginx_access_log(lines=100)
         )
         dialog.exec()
 
     def _view_nginx_error_log(self) -> None:
         """Show nginx error log dialog."""
-        logs, source = web_logs.get_nginx_error_log(lines=100)
         dialog = LogsDialog(
             "Nginx Error Log",
-            logs,
-            refresh_callback=lambda: web_logs.get_nginx_error_log(lines=100)[0],
-            source=source
+            fetch=lambda: web_logs.get_nginx_error_log(lines=100)
         )
         dialog.exec()
 
     def _view_php_error_log(self) -> None:
         """Show PHP error log dialog."""
-        logs, source = web_logs.get_php_error_log(lines=100)
         dialog = LogsDialog(
             "PHP Error Log",
-            logs,
-            refresh_callback=lambda: web_logs.get_php_error_log(lines=100)[0],
-            source=source
+            fetch=lambda: web_logs.get_php_error_log(lines=100)
         )
         dialog.exec()
 
@@ -928,64 +1338,78 @@ class PHPStackTray:
         for service_name in self._status_actions.keys():
             display_name = f"{service_name} (service)"
             log_sources[display_name] = (
-                lambda sn=service_name: self._systemd.get_logs(sn),
+                lambda sn=service_name: self._systemd.get_logs(
+                    sn, lines=UnifiedLogsDialog.MAX_LOG_BLOCKS
+                ),
                 f"journalctl -u {service_name}.service"
             )
 
-        # Add web logs
+        # Add web logs (source descriptors come from a stat, not a read)
         if web_logs.has_nginx_logs():
             log_sources["Nginx Access Log"] = (
                 lambda: web_logs.get_nginx_access_log(lines=200)[0],
-                web_logs.get_nginx_access_log(lines=1)[1]
+                web_logs.get_nginx_access_source()
             )
             log_sources["Nginx Error Log"] = (
                 lambda: web_logs.get_nginx_error_log(lines=200)[0],
-                web_logs.get_nginx_error_log(lines=1)[1]
+                web_logs.get_nginx_error_source()
             )
 
-        # Add PHP error log
+        # Add PHP error log; one 1-line probe yields its source
         if self._systemd.is_service_installed("php-fpm"):
+            php_source = web_logs.get_php_error_log(lines=1)[1]
             log_sources["PHP Error Log"] = (
                 lambda: web_logs.get_php_error_log(lines=200)[0],
-                web_logs.get_php_error_log(lines=1)[1]
+                php_source
             )
 
         dialog = UnifiedLogsDialog(log_sources)
         dialog.exec()
 
     def _build_config_menu(self, menu: QMenu, configs: dict) -> None:
-        """Build the config files submenu."""
+        """Build the config files submenu.
+
+        The payload rides on the action via setData and one shared slot
+        reads it back from sender(), so a rebuild allocates no per-item
+        closures no matter how many config files exist.
+        """
         for category, files in configs.items():
             if len(configs) > 1:
                 # Add category as submenu if multiple categories
                 cat_menu = QMenu(category, menu)
                 for cf in files:
                     action = QAction(cf.name, cat_menu)
-                    action.triggered.connect(lambda checked, path=cf.path: self._open_config_file(path))
+                    action.setData(str(cf.path))
+                    action.triggered.connect(self._on_config_action)
                     cat_menu.addAction(action)
                 menu.addMenu(cat_menu)
             else:
                 # Single category, add directly
                 for cf in files:
                     action = QAction(f"{cf.name}", menu)
-                    action.triggered.connect(lambda checked, path=cf.path: self._open_config_file(path))
+                    action.setData(str(cf.path))
+                    action.triggered.connect(self._on_config_action)
                     menu.addAction(action)
 
+    def _on_config_action(self) -> None:
+        """Shared slot for config file actions; path comes from setData."""
+        self._open_config_file(self.sender().data())
+
+    def _launch(self, binary: Optional[str], arg: str) -> bool:
+        """Spawn a pre-resolved viewer binary; True on success."""
+        if not binary:
+            return False
+        return _spawn_detached([binary, arg])
+
     def _open_config_file(self, path: str) -> None:
         """Open a config file in the default editor."""
-        import subprocess
-        try:
-            subprocess.Popen(["xdg-open", path], start_new_session=True)
-        except Exception:
+        if not self._launch(self._xdg_open or self._editor, path):
             self._show_notification(f"Could not open {path}", error=True)
 
     def _open_in_browser(self, domain: str) -> None:
         """Open a domain in the default browser."""
-        import subprocess
         url = f"http://{domain}"
-        try:
-            subprocess.Popen(["xdg-open", url], start_new_session=True)
-        except Exception:
+        if not self._launch(self._xdg_open, url):
             self._show_notification(f"Could not open {url}", error=True)
 
     def _show_sites_dialog(self) -> None:
@@ -1016,7 +1440,8 @@ class PHPStackTray:
             switch_action = QAction("Switch to this version", version_menu)
             switch_action.setCheckable(True)
             switch_action.setChecked(v.version == active_version)
-            switch_action.triggered.connect(lambda checked, ver=v: self._switch_php_version(ver))
+            switch_action.setData(v)
+            switch_action.triggered.connect(self._on_switch_version_action)
             version_menu.addAction(switch_action)
             self._php_version_actions[v.version] = switch_action
 
@@ -1024,22 +1449,34 @@ class PHPStackTray:
             ini_path = php_versions.get_php_ini_path(v)
             if ini_path:
                 ini_action = QAction(f"Edit php.ini", version_menu)
-                ini_action.triggered.connect(lambda checked, path=ini_path: self._open_php_ini(path))
+                ini_action.setData(ini_path)
+                ini_action.triggered.connect(self._on_php_ini_action)
                 version_menu.addAction(ini_action)
 
             # Set icon based on active status
             if v.version == active_version:
-                version_menu.setIcon(self._create_status_icon(ServiceState.ACTIVE))
+                version_menu.setIcon(self._status_icons[ServiceState.ACTIVE])
             else:
-                version_menu.setIcon(self._create_status_icon(ServiceState.INACTIVE))
+                version_menu.setIcon(self._status_icons[ServiceState.INACTIVE])
 
             self._php_version_menu.addMenu(version_menu)
 
+    def _on_switch_version_action(self) -> None:
+        """Shared slot for version switch actions; PhpVersion on setData."""
+        self._switch_php_version(self.sender().data())
+
+    def _on_php_ini_action(self) -> None:
+        """Shared slot for php.ini actions; path comes from setData."""
+        self._open_php_ini(self.sender().data())
+
     def _switch_php_version(self, version) -> None:
         """Switch to a different PHP version."""
         success, message = php_versions.switch_php_version(version)
 
         if success:
+            # PHP binaries and FPM sockets just changed; re-probe on next use
+            self._version_cache.clear()
+            vhosts.invalidate_detection_cache()
             self._show_notification(f"Switched to PHP {version.version}")
             # Update menu checkmarks
             for v, action in self._php_version_actions.items():
@@ -1049,37 +1486,19 @@ class PHPStackTray:
                     text += " (active)"
                 action.setText(text)
             # Refresh service status
-            QTimer.singleShot(1000, self._refresh_status)
+            QTimer.singleShot(1000, self._request_refresh)
         else:
             self._show_notification(message, error=True)
 
     def _open_php_ini(self, path: str) -> None:
-        """Open php.ini in the default editor."""
-        import os
-
-        # Try editors in order of preference
-        editors = [
-            os.environ.get("EDITOR"),      # User's preferred editor
-            os.environ.get("VISUAL"),      # User's visual editor
-            "xdg-open",                    # Desktop default
-            "kate",                        # KDE
-            "gedit",                       # GNOME
-            "mousepad",                    # XFCE
-            "featherpad",                  # LXQt
-            "pluma",                       # MATE
-            "xed",                         # Cinnamon
-            "code",                        # VS Code
-        ]
+        """Open php.ini in the default editor.
 
-        for editor in editors:
-            if editor:
-                try:
-                    subprocess.Popen([editor, path], start_new_session=True)
-                    return
-                except Exception:
-                    continue
-
-        self._show_notification(f"Could not open {path}", error=True)
+        The editor preference chain ($EDITOR, $VISUAL, xdg-open, common
+        DE editors) was resolved once at startup, so this is one fork
+        instead of a trial-and-error Popen loop per click.
+        """
+        if not self._launch(self._editor or self._xdg_open, path):
+            self._show_notification(f"Could not open {path}", error=True)
 
     def _toggle_xdebug(self) -> None:
         """Toggle Xdebug on/off and restart PHP-FPM."""
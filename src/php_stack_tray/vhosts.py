@@ -1,12 +1,25 @@
 """Virtual hosts management for Nginx."""
 
-import subprocess
+import functools
+import os
+import shlex
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-from .systemd_client import is_flatpak
+from ._proc import run_command, run_command_with_stdin, run_shell as _run_shell
+
+
+def _run_command(cmd: list[str]) -> tuple[bool, str]:
+    """Run a command (30s timeout: pkexec may wait on the auth dialog)."""
+    return run_command(cmd, timeout=30)
+
+
+def _run_command_with_stdin(cmd: list[str], stdin_bytes: bytes) -> tuple[bool, str]:
+    """Run a command with bytes fed on stdin (30s timeout, as above)."""
+    return run_command_with_stdin(cmd, stdin_bytes, timeout=30)
 
 
 # Nginx path configurations for different distros
@@ -25,6 +38,12 @@ NGINX_PATHS = {
 
 HOSTS_FILE = Path("/etc/hosts")
 
+# Version number embedded in a PHP-FPM socket filename
+_SOCKET_VER_RE = re.compile(r'php(\d+\.?\d*)')
+
+# fastcgi_pass directive, for swapping the socket in place
+_FASTCGI_SUB_RE = re.compile(r'(fastcgi_pass\s+unix:)[^;]+;')
+
 # Common PHP-FPM socket locations with version info
 # Format: (socket_path, version_label)
 PHP_FPM_SOCKET_PATTERNS = [
@@ -89,7 +108,7 @@ class VirtualHost:
             if pattern == self.php_socket:
                 return version
         # Try to parse from socket filename
-        match = re.search(r'php(\d+\.?\d*)', self.php_socket)
+        match = _SOCKET_VER_RE.search(self.php_socket)
         if match:
             ver = match.group(1)
             if '.' not in ver and len(ver) == 2:
@@ -98,8 +117,10 @@ class VirtualHost:
         return "Default"
 
 
+@functools.lru_cache(maxsize=1)
 def _detect_nginx_style() -> dict:
-    """Detect which nginx configuration style is used."""
+    """Detect which nginx configuration style is used (cached; the
+    layout never changes while the tray runs)."""
     # Check Debian-style first (more specific)
     if NGINX_PATHS["debian"]["available"].exists():
         return NGINX_PATHS["debian"]
@@ -110,13 +131,20 @@ def _detect_nginx_style() -> dict:
     return NGINX_PATHS["debian"]
 
 
+def invalidate_detection_cache() -> None:
+    """Drop the cached layout/socket detection (e.g. after an FPM
+    install or version switch changes the available sockets)."""
+    _detect_nginx_style.cache_clear()
+    _detect_php_fpm_socket.cache_clear()
+
+
 def get_available_php_versions() -> list[PhpVersion]:
     """Get all available PHP-FPM versions (sockets that exist)."""
     versions = []
     seen_versions = set()
 
     for socket_path, version in PHP_FPM_SOCKET_PATTERNS:
-        if Path(socket_path).exists() and version not in seen_versions:
+        if os.path.exists(socket_path) and version not in seen_versions:
             versions.append(PhpVersion(version=version, socket_path=socket_path))
             seen_versions.add(version)
 
@@ -129,8 +157,9 @@ def get_available_php_versions() -> list[PhpVersion]:
     return sorted(versions, key=sort_key, reverse=True)
 
 
+@functools.lru_cache(maxsize=1)
 def _detect_php_fpm_socket() -> str:
-    """Detect the default PHP-FPM socket path."""
+    """Detect the default PHP-FPM socket path (cached)."""
     versions = get_available_php_versions()
     if versions:
         # Prefer Default, otherwise first available
@@ -142,9 +171,9 @@ def _detect_php_fpm_socket() -> str:
     return "/run/php-fpm/php-fpm.sock"
 
 
-def _get_vhost_template(php_socket: str) -> str:
-    """Get the nginx vhost template with the correct PHP-FPM socket."""
-    return """server {{
+# Raw vhost template; {php_socket} is substituted by _get_vhost_template,
+# the remaining placeholders by create_vhost's .format call
+_VHOST_TEMPLATE = """server {{
     listen 80;
     server_name {server_name};
     root {document_root};
@@ -168,80 +197,186 @@ def _get_vhost_template(php_socket: str) -> str:
     error_log /var/log/nginx/{{name}}_error.log;
     access_log /var/log/nginx/{{name}}_access.log;
 }}
-""".replace("{php_socket}", php_socket)
-
+"""
 
-def _run_command(cmd: list[str]) -> tuple[bool, str]:
-    """Run a command, using flatpak-spawn if in Flatpak sandbox."""
-    if is_flatpak():
-        cmd = ["flatpak-spawn", "--host"] + cmd
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        return result.returncode == 0, result.stdout + result.stderr
-    except Exception as e:
-        return False, str(e)
 
+@functools.lru_cache(maxsize=8)
+def _get_vhost_template(php_socket: str) -> str:
+    """Get the nginx vhost template with the correct PHP-FPM socket.
 
-def _run_shell(cmd: str) -> tuple[bool, str]:
-    """Run a shell command."""
-    if is_flatpak():
-        cmd = f"flatpak-spawn --host bash -c '{cmd}'"
+    Only a handful of socket paths ever occur, so the rendered template
+    is memoized per socket.
+    """
+    return _VHOST_TEMPLATE.replace("{php_socket}", php_socket)
+
+
+# Split once at import: the {{ }} format escapes collapse to literal
+# braces, then the template is cut at its three placeholders. Rendering
+# is a b"".join of pre-encoded static fragments plus the three values —
+# no format-string scan and no encode of the static bulk per create.
+# ({{name}} stays the literal {name}, as under .format.)
+_split = re.split(
+    r"\{(server_name|document_root|php_socket)\}",
+    _VHOST_TEMPLATE.replace("{{", "{").replace("}}", "}"),
+)
+_VHOST_PARTS = tuple(part.encode() for part in _split[::2])
+_VHOST_FIELDS = tuple(_split[1::2])
+del _split
+
+
+def _render_vhost_config(server_name: str, document_root: str, php_socket: str) -> bytes:
+    """Render the final vhost config bytes for create_vhost."""
+    values = {
+        "server_name": server_name,
+        "document_root": document_root,
+        "php_socket": php_socket,
+    }
+    pieces = [_VHOST_PARTS[0]]
+    for field, part in zip(_VHOST_FIELDS, _VHOST_PARTS[1:]):
+        pieces.append(values[field].encode())
+        pieces.append(part)
+    return b"".join(pieces)
+
+
+# Parse results stamped with (st_mtime_ns, st_size); unchanged configs
+# cost one stat on re-scan instead of a read plus several regex passes.
+_PARSE_CACHE: dict[str, tuple[tuple[int, int], tuple[Optional[str], Optional[str], Optional[str]]]] = {}
+_SERVER_BLOCK_CACHE: dict[str, tuple[tuple[int, int], bool]] = {}
+
+# One compiled scanner for everything the vhost helpers look for; a
+# single finditer pass replaces several separate full-content searches.
+_VHOST_SCAN_RE = re.compile(
+    r'(?:server_name\s+(?P<server_name>[^;]+);)'
+    r'|(?:^\s*root\s+(?P<root>[^;]+);)'
+    r'|(?:fastcgi_pass\s+unix:(?P<socket>[^;]+);)'
+    r'|(?P<server_block>server\s*\{)',
+    re.MULTILINE
+)
+
+
+def _file_stamp(path: Path) -> Optional[tuple[int, int]]:
     try:
-        result = subprocess.run(
-            cmd,
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        return result.returncode == 0, result.stdout
-    except Exception as e:
-        return False, str(e)
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
 
 
 def _parse_vhost_config(config_path: Path) -> tuple[Optional[str], Optional[str], Optional[str]]:
     """Parse server_name, root, and php socket from nginx config."""
+    stamp = _file_stamp(config_path)
+    if stamp is not None:
+        cached = _PARSE_CACHE.get(str(config_path))
+        if cached and cached[0] == stamp:
+            return cached[1]
+
     server_name = None
     document_root = None
     php_socket = None
 
     try:
-        content = config_path.read_text()
-
-        # Extract server_name
-        match = re.search(r'server_name\s+([^;]+);', content)
-        if match:
-            server_name = match.group(1).strip()
-
-        # Extract root
-        match = re.search(r'^\s*root\s+([^;]+);', content, re.MULTILINE)
-        if match:
-            document_root = match.group(1).strip()
-
-        # Extract PHP-FPM socket from fastcgi_pass
-        match = re.search(r'fastcgi_pass\s+unix:([^;]+);', content)
-        if match:
-            php_socket = match.group(1).strip()
+        # The directives nearly always sit at the top of the file; read
+        # in chunks and stop once all three are captured, so a long
+        # commented-out tail is never read or decoded. Rescanning the
+        # accumulated text per chunk keeps boundary-straddling
+        # directives correct, and the is-None guards keep earlier
+        # captures stable across rescans.
+        with open(config_path, "r", errors="replace") as f:
+            content = ""
+            while True:
+                chunk = f.read(4096)
+                if not chunk:
+                    break
+                content += chunk
+                for match in _VHOST_SCAN_RE.finditer(content):
+                    if server_name is None and match.group('server_name'):
+                        server_name = match.group('server_name').strip()
+                    elif document_root is None and match.group('root'):
+                        document_root = match.group('root').strip()
+                    elif php_socket is None and match.group('socket'):
+                        php_socket = match.group('socket').strip()
+                    if server_name and document_root and php_socket:
+                        break
+                if server_name and document_root and php_socket:
+                    break
 
     except Exception:
         pass
 
-    return server_name, document_root, php_socket
+    result = (server_name, document_root, php_socket)
+    if stamp is not None:
+        _PARSE_CACHE[str(config_path)] = (stamp, result)
+    return result
 
 
 def _is_vhost_config(config_path: Path) -> bool:
     """Check if a config file is a virtual host (has server block)."""
+    stamp = _file_stamp(config_path)
+    if stamp is not None:
+        cached = _SERVER_BLOCK_CACHE.get(str(config_path))
+        if cached and cached[0] == stamp:
+            return cached[1]
+
     try:
         content = config_path.read_text()
-        return bool(re.search(r'server\s*\{', content))
+        # Cheap substring pre-filter: non-server snippets (maps,
+        # upstreams, includes) skip the regex scan entirely
+        result = "server" in content and any(
+            match.group('server_block')
+            for match in _VHOST_SCAN_RE.finditer(content)
+        )
     except Exception:
         return False
 
+    if stamp is not None:
+        _SERVER_BLOCK_CACHE[str(config_path)] = (stamp, result)
+    return result
+
+
+# Scan results keyed on the sites directories, stamped with their
+# mtimes; a repeat call with unchanged directories skips re-reading and
+# re-parsing every config file.
+_vhost_cache: dict[tuple[str, str], tuple[tuple[int, int], list[VirtualHost]]] = {}
+
+
+def invalidate_vhost_cache() -> None:
+    """Drop cached vhost scans (call after changing configs)."""
+    _vhost_cache.clear()
+    _PARSE_CACHE.clear()
+    _SERVER_BLOCK_CACHE.clear()
+
+
+def _dir_mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return -1
+
+
+# Below this many files the thread-pool handoff costs more than it saves
+_PARSE_POOL_THRESHOLD = 4
+
+
+def _map_configs(func, paths: list[Path]) -> list:
+    """Apply a config probe to every path, overlapping the file I/O.
+
+    A cold-cache scan is dominated by the open+read syscalls; a small
+    thread pool runs them concurrently so a directory of configs costs
+    roughly its slowest file instead of the sum. Small batches stay
+    sequential.
+    """
+    if len(paths) < _PARSE_POOL_THRESHOLD:
+        return [func(p) for p in paths]
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+        return list(pool.map(func, paths))
+
+
+def _probe_confd_config(config_file: Path):
+    """Parse a conf.d config, or None if it holds no server block."""
+    if not _is_vhost_config(config_file):
+        return None
+    return _parse_vhost_config(config_file)
+
 
 def get_virtual_hosts() -> list[VirtualHost]:
     """Get list of all virtual hosts."""
@@ -251,60 +386,90 @@ def get_virtual_hosts() -> list[VirtualHost]:
     sites_enabled = nginx_style["enabled"]
     uses_symlinks = nginx_style["uses_symlinks"]
 
+    cache_key = (str(sites_available), str(sites_enabled))
+    stamp = (_dir_mtime_ns(sites_available), _dir_mtime_ns(sites_enabled))
+    cached = _vhost_cache.get(cache_key)
+    if cached and cached[0] == stamp:
+        return list(cached[1])
+
     if not sites_available.exists():
         return vhosts
 
     if uses_symlinks:
-        # Debian-style: sites-available + sites-enabled symlinks
+        # Debian-style: sites-available + sites-enabled symlinks.
+        # scandir answers is_file/is_symlink from the directory entry
+        # itself instead of one stat per Path object.
         enabled_sites = set()
-        if sites_enabled.exists():
-            for link in sites_enabled.iterdir():
-                if link.is_symlink():
-                    target = link.resolve()
-                    enabled_sites.add(target.name)
-
-        for config_file in sites_available.iterdir():
-            if config_file.is_file() and not config_file.name.startswith('.'):
-                server_name, document_root, php_socket = _parse_vhost_config(config_file)
-                vhosts.append(VirtualHost(
-                    name=config_file.name,
-                    config_path=config_file,
-                    enabled=config_file.name in enabled_sites,
-                    server_name=server_name,
-                    document_root=document_root,
-                    php_socket=php_socket
-                ))
+        try:
+            with os.scandir(sites_enabled) as entries:
+                for entry in entries:
+                    if entry.is_symlink():
+                        # One readlink beats resolve(), which stats every
+                        # path component to canonicalize the whole chain
+                        try:
+                            target = os.readlink(entry.path)
+                        except OSError:
+                            continue
+                        enabled_sites.add(os.path.basename(target))
+        except OSError:
+            pass
+        # Frozen for the membership checks below; the set is built once
+        # and only ever probed from here on
+        enabled_sites = frozenset(enabled_sites)
+
+        pending = []
+        with os.scandir(sites_available) as entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_file() and not name.startswith('.'):
+                    pending.append((name, Path(entry.path)))
+
+        parses = _map_configs(_parse_vhost_config, [p for _, p in pending])
+        for (name, config_file), (server_name, document_root, php_socket) in zip(pending, parses):
+            vhosts.append(VirtualHost(
+                name=name,
+                config_path=config_file,
+                enabled=name in enabled_sites,
+                server_name=server_name,
+                document_root=document_root,
+                php_socket=php_socket
+            ))
     else:
-        # conf.d style: all .conf files are enabled
-        for config_file in sites_available.iterdir():
-            # Only include .conf files that contain server blocks
-            if config_file.is_file() and config_file.suffix == '.conf':
-                if _is_vhost_config(config_file):
-                    server_name, document_root, php_socket = _parse_vhost_config(config_file)
-                    vhosts.append(VirtualHost(
-                        name=config_file.stem,  # Remove .conf
-                        config_path=config_file,
-                        enabled=True,
-                        server_name=server_name,
-                        document_root=document_root,
-                        php_socket=php_socket
-                    ))
-
-        # Also check for disabled configs (.conf.disabled)
-        for config_file in sites_available.iterdir():
-            if config_file.is_file() and config_file.name.endswith('.conf.disabled'):
-                if _is_vhost_config(config_file):
-                    server_name, document_root, php_socket = _parse_vhost_config(config_file)
-                    vhosts.append(VirtualHost(
-                        name=config_file.name.replace('.conf.disabled', ''),
-                        config_path=config_file,
-                        enabled=False,
-                        server_name=server_name,
-                        document_root=document_root,
-                        php_socket=php_socket
-                    ))
-
-    return sorted(vhosts, key=lambda v: v.name)
+        # conf.d style: one directory pass, dispatching on the suffix.
+        # .conf files are enabled, .conf.disabled files are not; only
+        # files containing server blocks count as vhosts.
+        pending = []
+        with os.scandir(sites_available) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                if entry.name.endswith('.conf.disabled'):
+                    name = entry.name[:-len('.conf.disabled')]
+                    enabled = False
+                elif entry.name.endswith('.conf'):
+                    name = entry.name[:-len('.conf')]
+                    enabled = True
+                else:
+                    continue
+                pending.append((name, Path(entry.path), enabled))
+
+        parses = _map_configs(_probe_confd_config, [p for _, p, _ in pending])
+        for (name, config_file, enabled), parsed in zip(pending, parses):
+            if parsed is None:
+                continue  # no server block: not a vhost
+            server_name, document_root, php_socket = parsed
+            vhosts.append(VirtualHost(
+                name=name,
+                config_path=config_file,
+                enabled=enabled,
+                server_name=server_name,
+                document_root=document_root,
+                php_socket=php_socket
+            ))
+
+    vhosts = sorted(vhosts, key=lambda v: v.name)
+    _vhost_cache[cache_key] = (stamp, vhosts)
+    return list(vhosts)
 
 
 def enable_vhost(name: str) -> tuple[bool, str]:
@@ -347,6 +512,7 @@ def enable_vhost(name: str) -> tuple[bool, str]:
         if not success:
             return False, f"Failed to enable: {output}"
 
+    invalidate_vhost_cache()
     # Reload nginx
     _run_command(["pkexec", "systemctl", "reload", "nginx"])
     return True, "Virtual host enabled"
@@ -386,12 +552,14 @@ def disable_vhost(name: str) -> tuple[bool, str]:
         if not success:
             return False, f"Failed to disable: {output}"
 
+    invalidate_vhost_cache()
     # Reload nginx
     _run_command(["pkexec", "systemctl", "reload", "nginx"])
     return True, "Virtual host disabled"
 
 
-def create_vhost(name: str, server_name: str, document_root: str, php_socket: Optional[str] = None) -> tuple[bool, str]:
+def create_vhost(name: str, server_name: str, document_root: str, php_socket: Optional[str] = None,
+                 add_hosts: bool = False, enable: bool = False) -> tuple[bool, str]:
     """Create a new virtual host.
 
     Args:
@@ -399,6 +567,12 @@ def create_vhost(name: str, server_name: str, document_root: str, php_socket: Op
         server_name: Domain name
         document_root: Path to document root
         php_socket: Optional PHP-FPM socket path (auto-detected if None)
+        add_hosts: Also add a 127.0.0.1 hosts entry for server_name
+        enable: Also enable the new vhost and reload nginx
+
+    The optional steps run inside the same elevated shell as the config
+    write, so the whole new-site flow authenticates with polkit once
+    instead of once per command.
     """
     nginx_style = _detect_nginx_style()
     uses_symlinks = nginx_style["uses_symlinks"]
@@ -411,31 +585,43 @@ def create_vhost(name: str, server_name: str, document_root: str, php_socket: Op
     if config_path.exists():
         return False, f"Virtual host '{name}' already exists"
 
-    # Create document root if it doesn't exist
-    doc_root_path = Path(document_root)
-    if not doc_root_path.exists():
-        success, output = _run_command(["pkexec", "mkdir", "-p", document_root])
-        if not success:
-            return False, f"Failed to create document root: {output}"
-
     # Use provided socket or detect default
     if not php_socket:
         php_socket = _detect_php_fpm_socket()
-    template = _get_vhost_template(php_socket)
-    config_content = template.format(
-        name=name,
-        server_name=server_name,
-        document_root=document_root
-    )
-
-    # Write config file (need to use tee with pkexec)
-    success, output = _run_shell(
-        f"echo '{config_content}' | pkexec tee {config_path} > /dev/null"
+    config_content = _render_vhost_config(server_name, document_root, php_socket)
+
+    # One elevated shell does the doc root and the config write together:
+    # each separate pkexec is its own polkit round-trip and may prompt
+    # the user again mid-operation. The config content travels over
+    # stdin, never through shell text, so quoting and ARG_MAX are moot;
+    # shlex.quote keeps the paths out of shell interpretation.
+    script = ""
+    if not Path(document_root).exists():
+        script += f"mkdir -p {shlex.quote(document_root)} && "
+    script += f"cat > {shlex.quote(str(config_path))}"
+
+    if add_hosts and server_name:
+        hosts_content = _read_hosts_file()
+        if not _hosts_entry_re(server_name).search(hosts_content):
+            entry = f"127.0.0.1\t{server_name}"
+            script += f" && printf '%s\\n' {shlex.quote(entry)} >> /etc/hosts"
+
+    if enable:
+        if uses_symlinks:
+            target = nginx_style["enabled"] / name
+            script += (f" && ln -sf {shlex.quote(str(config_path))}"
+                       f" {shlex.quote(str(target))}")
+        # conf.d style: a fresh .conf file is enabled by definition
+        script += " && systemctl reload nginx"
+
+    success, output = _run_command_with_stdin(
+        ["pkexec", "bash", "-c", script], config_content
     )
 
     if not success:
         return False, f"Failed to create config: {output}"
 
+    invalidate_vhost_cache()
     return True, f"Virtual host '{name}' created"
 
 
@@ -467,22 +653,53 @@ def delete_vhost(name: str) -> tuple[bool, str]:
     if not success:
         return False, f"Failed to delete: {output}"
 
+    invalidate_vhost_cache()
     # Reload nginx
     _run_command(["pkexec", "systemctl", "reload", "nginx"])
     return True, "Virtual host deleted"
 
 
+# /etc/hosts content stamped with (st_mtime_ns, st_size); bulk vhost
+# creation rereads it once per change instead of forking grep per site
+_HOSTS_CACHE: dict[str, tuple[tuple[int, int], str]] = {}
+
+
+def _read_hosts_file() -> str:
+    stamp = _file_stamp(HOSTS_FILE)
+    if stamp is not None:
+        cached = _HOSTS_CACHE.get(str(HOSTS_FILE))
+        if cached and cached[0] == stamp:
+            return cached[1]
+    try:
+        content = HOSTS_FILE.read_text()
+    except OSError:
+        return ""
+    if stamp is not None:
+        _HOSTS_CACHE[str(HOSTS_FILE)] = (stamp, content)
+    return content
+
+
+@functools.lru_cache(maxsize=32)
+def _hosts_entry_re(hostname: str) -> re.Pattern:
+    """Matcher for an /etc/hosts line that already maps the hostname.
+
+    Compiled once per hostname; re.escape keeps the hostname a literal.
+    """
+    return re.compile(rf'(?m)^\s*\S+\s+.*\b{re.escape(hostname)}(\s|$)')
+
+
 def add_hosts_entry(hostname: str, ip: str = "127.0.0.1") -> tuple[bool, str]:
     """Add entry to /etc/hosts."""
-    # Check if entry already exists
-    success, content = _run_shell(f"grep -q '{hostname}' /etc/hosts && echo exists")
-    if "exists" in content:
+    # The file is tiny: an in-process read beats shelling out to grep
+    content = _read_hosts_file()
+    if _hosts_entry_re(hostname).search(content):
         return True, "Hosts entry already exists"
 
-    # Add entry
-    entry = f"{ip}\t{hostname}"
-    success, output = _run_shell(
-        f"echo '{entry}' | pkexec tee -a /etc/hosts > /dev/null"
+    # Append via one elevated tee fed over stdin: no bash, no echo, and
+    # the entry never passes through shell quoting
+    entry = f"{ip}\t{hostname}\n"
+    success, output = _run_command_with_stdin(
+        ["pkexec", "tee", "-a", str(HOSTS_FILE)], entry.encode()
     )
 
     if not success:
@@ -493,8 +710,18 @@ def add_hosts_entry(hostname: str, ip: str = "127.0.0.1") -> tuple[bool, str]:
 
 def remove_hosts_entry(hostname: str) -> tuple[bool, str]:
     """Remove entry from /etc/hosts."""
-    success, output = _run_shell(
-        f"pkexec sed -i '/{hostname}/d' /etc/hosts"
+    # Filter in Python and rewrite in one elevated tee: no shell parse,
+    # no raw hostname inside a sed expression, and nothing to do at all
+    # when the entry is not there
+    content = _read_hosts_file()
+    pattern = re.compile(rf'\b{re.escape(hostname)}\b')
+    lines = content.splitlines(keepends=True)
+    filtered = [line for line in lines if not pattern.search(line)]
+    if len(filtered) == len(lines):
+        return True, "Hosts entry removed"
+
+    success, output = _run_command_with_stdin(
+        ["pkexec", "tee", str(HOSTS_FILE)], "".join(filtered).encode()
     )
 
     if not success:
@@ -512,7 +739,9 @@ def test_nginx_config() -> tuple[bool, str]:
 def has_nginx_sites() -> bool:
     """Check if nginx sites directory exists."""
     nginx_style = _detect_nginx_style()
-    return nginx_style["available"].exists()
+    # os.path.isdir: one C-level stat, no Path.exists dispatch; this
+    # runs on every UI redraw
+    return os.path.isdir(str(nginx_style["available"]))
 
 
 def change_vhost_php_version(config_path: Path, new_socket: str) -> tuple[bool, str]:
@@ -526,11 +755,7 @@ def change_vhost_php_version(config_path: Path, new_socket: str) -> tuple[bool,
         return False, f"Failed to read config: {e}"
 
     # Replace fastcgi_pass line
-    new_content = re.sub(
-        r'(fastcgi_pass\s+unix:)[^;]+(;)',
-        rf'\1{new_socket}\2',
-        content
-    )
+    new_content = _FASTCGI_SUB_RE.sub(rf'\g<1>{new_socket};', content)
 
     if new_content == content:
         return False, "No fastcgi_pass directive found in config"
@@ -545,6 +770,10 @@ def change_vhost_php_version(config_path: Path, new_socket: str) -> tuple[bool,
     if not success:
         return False, f"Failed to write config: {output}"
 
+    # In-place rewrites don't bump the directory mtime, so the scan
+    # cache must be dropped explicitly
+    invalidate_vhost_cache()
+
     # Reload nginx
     _run_command(["pkexec", "systemctl", "reload", "nginx"])
 
@@ -1,13 +1,17 @@
 """Web server log viewing functionality."""
 
-import subprocess
+import functools
+import os
+import time
 from pathlib import Path
 from typing import Optional
 
-from .systemd_client import is_flatpak
+from ._proc import _IN_FLATPAK, run_command as _run_command, run_shell as _run_shell
 
 
 # Log file locations
+NGINX_LOG_DIR = "/var/log/nginx"
+
 NGINX_LOG_PATHS = {
     "access": [
         "/var/log/nginx/access.log",
@@ -42,40 +46,81 @@ PHP_FPM_SERVICES = [
 ]
 
 
-def _run_shell(cmd: str) -> tuple[bool, str]:
-    """Run a shell command."""
-    if is_flatpak():
-        cmd = f"flatpak-spawn --host bash -c '{cmd}'"
+@functools.lru_cache(maxsize=1)
+def _nginx_log_index(nginx_dir_mtime_ns: int) -> dict[str, str]:
+    """Filenames in /var/log/nginx, from one scandir.
+
+    Keyed by the directory's mtime so log rotation invalidates the
+    index; until then every lookup is a dict hit instead of a stat.
+    """
+    index = {}
     try:
-        result = subprocess.run(
-            cmd,
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        return result.returncode == 0, result.stdout
-    except Exception as e:
-        return False, str(e)
+        with os.scandir(NGINX_LOG_DIR) as entries:
+            for entry in entries:
+                index[entry.name] = entry.path
+    except OSError:
+        pass
+    return index
+
+
+def _nginx_dir_stamp() -> int:
+    try:
+        return os.stat(NGINX_LOG_DIR).st_mtime_ns
+    except OSError:
+        return -1
 
 
 def _find_log_file(paths: list[str]) -> Optional[str]:
     """Find the first existing log file from a list of paths."""
+    index = None
     for path in paths:
-        if Path(path).exists():
+        head, name = os.path.split(path)
+        if head == NGINX_LOG_DIR:
+            # One scandir covers all candidates in the nginx log dir
+            if index is None:
+                index = _nginx_log_index(_nginx_dir_stamp())
+            if name in index:
+                return index[name]
+        # os.path.exists: one access() per candidate, no Path allocation
+        elif os.path.exists(path):
             return path
     return None
 
 
+def _tail_bytes(path: str, lines: int, blocksize: int = 65536) -> Optional[str]:
+    """Read the last N lines of a file by seeking from the end.
+
+    Reading backwards in blocks keeps the cost proportional to the tail
+    instead of the file, which matters for multi-hundred-MB access logs.
+    Returns None if the file cannot be read.
+    """
+    try:
+        with open(path, 'rb') as f:
+            f.seek(0, 2)
+            pos = f.tell()
+            data = b""
+            while pos > 0 and data.count(b"\n") <= lines:
+                step = min(blocksize, pos)
+                pos -= step
+                f.seek(pos)
+                data = f.read(step) + data
+        return b"\n".join(data.splitlines()[-lines:]).decode("utf-8", errors="replace")
+    except OSError:
+        return None
+
+
 def _read_log_file(path: str, lines: int = 100) -> tuple[str, str]:
     """Read the last N lines from a log file."""
     if not Path(path).exists():
         return f"Log file not found: {path}", path
 
-    success, output = _run_shell(f"tail -n {lines} '{path}' 2>/dev/null")
-    if success:
-        return output if output.strip() else "(empty log file)", path
-    return f"Failed to read log file: {path}", path
+    output = None if _IN_FLATPAK else _tail_bytes(path, lines)
+    if output is None:
+        # Sandboxed (or unreadable): let the host shell read it
+        success, output = _run_shell(f"tail -n {lines} '{path}' 2>/dev/null")
+        if not success:
+            return f"Failed to read log file: {path}", path
+    return output if output.strip() else "(empty log file)", path
 
 
 def get_nginx_access_log(lines: int = 100) -> tuple[str, str]:
@@ -94,12 +139,39 @@ def get_nginx_error_log(lines: int = 100) -> tuple[str, str]:
     return _read_log_file(log_path, lines)
 
 
+def get_nginx_access_source() -> str:
+    """Path of the nginx access log, without reading any of it."""
+    return _find_log_file(NGINX_LOG_PATHS["access"]) or "No file"
+
+
+def get_nginx_error_source() -> str:
+    """Path of the nginx error log, without reading any of it."""
+    return _find_log_file(NGINX_LOG_PATHS["error"]) or "No file"
+
+
+# The configured error_log only changes with php.ini edits; keep the
+# probe result this long so repeated viewer opens skip the PHP startup.
+_ERROR_LOG_TTL_SECONDS = 30.0
+
+
+def _php_error_log_setting() -> str:
+    """Configured error_log from PHP (cached for a short TTL)."""
+    return _php_error_log_probe(int(time.monotonic() // _ERROR_LOG_TTL_SECONDS))
+
+
+@functools.lru_cache(maxsize=1)
+def _php_error_log_probe(bucket: int) -> str:
+    # One php process, no shell/grep/awk pipeline
+    success, output = _run_command(["php", "-r", "echo ini_get('error_log');"])
+    return output.strip() if success else ""
+
+
 def get_php_error_log(lines: int = 100) -> tuple[str, str]:
     """Get PHP error log content."""
     # First try configured error_log from PHP
-    success, output = _run_shell("php -i 2>/dev/null | grep '^error_log' | awk '{print $3}'")
-    if success and output.strip() and output.strip() != "no" and Path(output.strip()).exists():
-        return _read_log_file(output.strip(), lines)
+    configured = _php_error_log_setting()
+    if configured and configured != "no" and Path(configured).exists():
+        return _read_log_file(configured, lines)
 
     # Try common locations
     log_path = _find_log_file(PHP_ERROR_LOG_PATHS)
@@ -120,5 +192,6 @@ def get_php_error_log(lines: int = 100) -> tuple[str, str]:
 
 def has_nginx_logs() -> bool:
     """Check if any nginx logs exist."""
-    return bool(_find_log_file(NGINX_LOG_PATHS["access"]) or
-                _find_log_file(NGINX_LOG_PATHS["error"]))
+    # A non-empty /var/log/nginx means nginx is installed and logging;
+    # one stat against the cached index instead of up to four exists()
+    return bool(_nginx_log_index(_nginx_dir_stamp()))
@@ -1,10 +1,22 @@
 """Xdebug toggle functionality."""
 
-import subprocess
+import functools
+import glob
+import os
+import re
 from pathlib import Path
 from typing import Optional
 
-from .systemd_client import is_flatpak
+from ._proc import _IN_FLATPAK, run_command as _run_command, run_shell as _run_shell
+
+
+# The zend_extension line that loads Xdebug, commented or not; group 1
+# captures the leading semicolon when the line is disabled. A bytes
+# pattern over read_bytes() avoids both the utf-8 decode and any line
+# materialization.
+_ZEND_LINE_RE = re.compile(
+    rb'^\s*(;?)\s*zend_extension\s*=.*xdebug', re.MULTILINE | re.IGNORECASE
+)
 
 
 # Common Xdebug config locations
@@ -26,51 +38,72 @@ XDEBUG_CONFIG_PATHS = [
     "/etc/php.d/xdebug.ini",
     "/etc/php.d/15-xdebug.ini",
     "/etc/php.d/20-xdebug.ini",
-    # Alpine
-    "/etc/php81/conf.d/xdebug.ini",
+    # Alpine (php81 conf.d shared with the AUR entry above)
     "/etc/php82/conf.d/00_xdebug.ini",
 ]
 
-
-def _run_command(cmd: list[str]) -> tuple[bool, str]:
-    """Run a command, using flatpak-spawn if in Flatpak sandbox."""
-    if is_flatpak():
-        cmd = ["flatpak-spawn", "--host"] + cmd
+# Which path prefixes to probe first per distro family
+_DISTRO_HINTS = {
+    "arch": ("/etc/php/conf.d/", "/etc/php8"),
+    "debian": ("/etc/php/",),
+    "ubuntu": ("/etc/php/",),
+    "fedora": ("/etc/php.d/",),
+    "rhel": ("/etc/php.d/",),
+    "centos": ("/etc/php.d/",),
+    "alpine": ("/etc/php8",),
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _distro_id() -> str:
+    """ID field from /etc/os-release, or '' when unreadable."""
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        return result.returncode == 0, result.stdout + result.stderr
-    except Exception as e:
-        return False, str(e)
-
-
-def _run_shell(cmd: str) -> tuple[bool, str]:
-    """Run a shell command."""
-    if is_flatpak():
-        cmd = f"flatpak-spawn --host bash -c '{cmd}'"
-    try:
-        result = subprocess.run(
-            cmd,
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        return result.returncode == 0, result.stdout + result.stderr
-    except Exception as e:
-        return False, str(e)
+        with open("/etc/os-release") as f:
+            for line in f:
+                if line.startswith("ID="):
+                    return line[3:].strip().strip('"')
+    except OSError:
+        pass
+    return ""
+
+
+@functools.lru_cache(maxsize=4)
+def _probe_order(paths: tuple[str, ...]) -> tuple[str, ...]:
+    """Dedupe the candidate paths and front-load the local distro's.
+
+    The probe loops stop at the first hit, so putting the likely family
+    first means a handful of stats instead of the full list.
+    """
+    deduped = dict.fromkeys(paths)
+    hints = _DISTRO_HINTS.get(_distro_id())
+    if not hints:
+        return tuple(deduped)
+    return tuple(sorted(
+        deduped, key=lambda p: not p.startswith(hints)
+    ))
+
+# Extension directories where xdebug.so may live
+_XDEBUG_SO_GLOBS = (
+    "/usr/lib/php*/modules/xdebug.so",
+    "/usr/lib64/php/modules/xdebug.so",
+    "/usr/lib/php/*/modules/xdebug.so",
+)
 
 
 def is_xdebug_installed() -> bool:
     """Check if Xdebug is installed (config file exists)."""
-    for path in XDEBUG_CONFIG_PATHS:
-        if Path(path).exists() or Path(f"{path}.disabled").exists():
+    # os.path.exists: one access() per candidate, no Path allocation
+    for path in _probe_order(tuple(XDEBUG_CONFIG_PATHS)):
+        if os.path.exists(path) or os.path.exists(f"{path}.disabled"):
             return True
-    # Also check if xdebug.so exists in common extension directories
+    # Also check if xdebug.so exists in common extension directories.
+    # Outside the sandbox an in-process glob answers this without any
+    # fork; inside Flatpak only the host shell can see those paths.
+    if not _IN_FLATPAK:
+        return any(
+            next(glob.iglob(pattern), None) is not None
+            for pattern in _XDEBUG_SO_GLOBS
+        )
     success, output = _run_shell(
         "php -m 2>/dev/null | grep -qi xdebug && echo yes || "
         "find /usr/lib/php*/modules /usr/lib64/php/modules /usr/lib/php/*/modules "
@@ -81,30 +114,78 @@ def is_xdebug_installed() -> bool:
 
 def is_xdebug_enabled() -> bool:
     """Check if Xdebug is currently enabled."""
-    success, output = _run_shell("php -m 2>/dev/null | grep -i xdebug")
+    # List form, no shell: the substring scan replaces the grep pipeline
+    success, output = _run_command(["php", "-m"])
     return "xdebug" in output.lower()
 
 
+# Located config path, stamped with the probe list and its parent
+# directories' mtimes; a toggle then stats ~5 directories instead of
+# walking all ~30 candidate paths twice
+_config_path_cache: Optional[tuple[tuple, tuple, Optional[Path]]] = None
+
+
+def _config_dirs_stamp(paths: tuple[str, ...]) -> tuple:
+    stamps = []
+    for directory in sorted({os.path.dirname(p) for p in paths}):
+        try:
+            stamps.append(os.stat(directory).st_mtime_ns)
+        except OSError:
+            stamps.append(-1)
+    return tuple(stamps)
+
+
+def invalidate_config_path_cache() -> None:
+    """Force the next get_xdebug_config_path call to re-probe."""
+    global _config_path_cache
+    _config_path_cache = None
+
+
 def get_xdebug_config_path() -> Optional[Path]:
-    """Find the Xdebug config file path."""
-    for path_str in XDEBUG_CONFIG_PATHS:
-        path = Path(path_str)
-        if path.exists():
-            return path
-        disabled_path = Path(f"{path_str}.disabled")
-        if disabled_path.exists():
-            return disabled_path
-    return None
+    """Find the Xdebug config file path (cached by directory mtimes)."""
+    global _config_path_cache
+    paths_key = _probe_order(tuple(XDEBUG_CONFIG_PATHS))
+    stamp = _config_dirs_stamp(paths_key)
+    cached = _config_path_cache
+    if cached and cached[0] == paths_key and cached[1] == stamp:
+        return cached[2]
+
+    result = None
+    for path_str in paths_key:
+        if os.path.exists(path_str):
+            result = Path(path_str)
+            break
+        disabled_path = f"{path_str}.disabled"
+        if os.path.exists(disabled_path):
+            result = Path(disabled_path)
+            break
+
+    _config_path_cache = (paths_key, stamp, result)
+    return result
+
+
+def _is_commented_text(content: bytes) -> bool:
+    """Whether the zend_extension line in the given config is commented."""
+    match = _ZEND_LINE_RE.search(content)
+    if match is None:
+        return True  # No zend_extension line found, treat as disabled
+    return match.group(1) == b";"
 
 
 def _is_commented_config(config_path: Path) -> bool:
     """Check if the zend_extension line is commented out."""
     try:
-        content = config_path.read_text()
-        for line in content.splitlines():
-            if "zend_extension" in line and "xdebug" in line.lower():
-                return line.strip().startswith(";")
-        return True  # No zend_extension line found, treat as disabled
+        stamp = os.stat(config_path).st_mtime_ns
+    except OSError:
+        return True
+    return _commented_config_probe(str(config_path), stamp)
+
+
+@functools.lru_cache(maxsize=32)
+def _commented_config_probe(path_str: str, stamp: int) -> bool:
+    """One precompiled search over the raw bytes, memoized per mtime."""
+    try:
+        return _is_commented_text(Path(path_str).read_bytes())
     except Exception:
         return True
 
@@ -121,6 +202,7 @@ def enable_xdebug() -> tuple[bool, str]:
         success, output = _run_command(["pkexec", "mv", str(config_path), new_path])
         if not success:
             return False, f"Failed to enable Xdebug: {output}"
+        invalidate_config_path_cache()
         return True, "Xdebug enabled"
 
     # Handle commented config (Arch Linux style)
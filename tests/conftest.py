@@ -1,45 +1,34 @@
 """Pytest configuration and fixtures."""
 
 import pytest
-from pathlib import Path
-import tempfile
-import shutil
 
 
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for tests."""
-    tmp = tempfile.mkdtemp()
-    yield Path(tmp)
-    shutil.rmtree(tmp)
-
-
-@pytest.fixture
-def nginx_debian_style(temp_dir):
+def nginx_debian_style(tmp_path):
     """Create a Debian-style nginx sites structure."""
-    sites_available = temp_dir / "sites-available"
-    sites_enabled = temp_dir / "sites-enabled"
+    sites_available = tmp_path / "sites-available"
+    sites_enabled = tmp_path / "sites-enabled"
     sites_available.mkdir()
     sites_enabled.mkdir()
     return {
         "available": sites_available,
         "enabled": sites_enabled,
-        "root": temp_dir,
+        "root": tmp_path,
     }
 
 
 @pytest.fixture
-def nginx_confd_style(temp_dir):
+def nginx_confd_style(tmp_path):
     """Create a conf.d-style nginx sites structure."""
-    conf_d = temp_dir / "conf.d"
+    conf_d = tmp_path / "conf.d"
     conf_d.mkdir()
     return {
         "conf_d": conf_d,
-        "root": temp_dir,
+        "root": tmp_path,
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_vhost_config():
     """Sample nginx vhost configuration."""
     return """server {
@@ -61,6 +50,18 @@ def sample_vhost_config():
 """
 
 
+@pytest.fixture(scope="session")
+def sample_vhost_config_file(tmp_path_factory, sample_vhost_config):
+    """Sample vhost config written to disk once per session.
+
+    The parse helpers only read the file, so every test can share one
+    copy instead of rewriting identical text per test.
+    """
+    path = tmp_path_factory.mktemp("vhosts") / "test.conf"
+    path.write_text(sample_vhost_config)
+    return path
+
+
 @pytest.fixture
 def sample_xdebug_config_enabled():
     """Sample Xdebug config (enabled)."""
@@ -79,3 +80,12 @@ xdebug.mode=debug
 xdebug.client_host=localhost
 xdebug.client_port=9003
 """
+
+
+@pytest.fixture(autouse=True)
+def clear_vhost_caches():
+    """Reset vhosts module caches so patched paths take effect per test."""
+    from php_stack_tray import vhosts
+    vhosts.invalidate_detection_cache()
+    vhosts.invalidate_vhost_cache()
+    yield
@@ -4,9 +4,6 @@ import pytest
 from pathlib import Path
 from unittest.mock import patch
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from php_stack_tray import config_files
 from php_stack_tray.config_files import ConfigFile
 
@@ -14,10 +11,10 @@ from php_stack_tray.config_files import ConfigFile
 class TestFindFile:
     """Tests for _find_file function."""
 
-    def test_find_first_existing(self, temp_dir):
+    def test_find_first_existing(self, tmp_path):
         """Test finding first existing file."""
-        file1 = temp_dir / "file1.conf"
-        file2 = temp_dir / "file2.conf"
+        file1 = tmp_path / "file1.conf"
+        file2 = tmp_path / "file2.conf"
         file1.write_text("content1")
         file2.write_text("content2")
 
@@ -28,23 +25,23 @@ class TestFindFile:
 
         assert result == str(file1)
 
-    def test_find_second_when_first_missing(self, temp_dir):
+    def test_find_second_when_first_missing(self, tmp_path):
         """Test finding second file when first doesn't exist."""
-        file2 = temp_dir / "file2.conf"
+        file2 = tmp_path / "file2.conf"
         file2.write_text("content2")
 
         result = config_files._find_file([
-            str(temp_dir / "nonexistent.conf"),
+            str(tmp_path / "nonexistent.conf"),
             str(file2),
         ])
 
         assert result == str(file2)
 
-    def test_none_when_all_missing(self, temp_dir):
+    def test_none_when_all_missing(self, tmp_path):
         """Test returning None when no files exist."""
         result = config_files._find_file([
-            str(temp_dir / "nonexistent1.conf"),
-            str(temp_dir / "nonexistent2.conf"),
+            str(tmp_path / "nonexistent1.conf"),
+            str(tmp_path / "nonexistent2.conf"),
         ])
 
         assert result is None
@@ -74,9 +71,9 @@ class TestConfigFile:
 class TestGetNginxConfigs:
     """Tests for get_nginx_configs function."""
 
-    def test_find_nginx_conf(self, temp_dir):
+    def test_find_nginx_conf(self, tmp_path):
         """Test finding nginx.conf."""
-        nginx_conf = temp_dir / "nginx.conf"
+        nginx_conf = tmp_path / "nginx.conf"
         nginx_conf.write_text("worker_processes 1;")
 
         with patch.object(config_files, '_find_file', side_effect=[
@@ -89,7 +86,7 @@ class TestGetNginxConfigs:
         assert len(configs) >= 1
         assert any(c.name == "nginx.conf" for c in configs)
 
-    def test_no_configs_found(self, temp_dir):
+    def test_no_configs_found(self, tmp_path):
         """Test when no nginx configs exist."""
         with patch.object(config_files, '_find_file', return_value=None):
             configs = config_files.get_nginx_configs()
@@ -100,9 +97,9 @@ class TestGetNginxConfigs:
 class TestGetPhpConfigs:
     """Tests for get_php_configs function."""
 
-    def test_find_php_fpm_conf(self, temp_dir):
+    def test_find_php_fpm_conf(self, tmp_path):
         """Test finding php-fpm.conf."""
-        fpm_conf = temp_dir / "php-fpm.conf"
+        fpm_conf = tmp_path / "php-fpm.conf"
         fpm_conf.write_text("[global]")
 
         with patch.object(config_files, '_find_file', side_effect=[
@@ -119,9 +116,9 @@ class TestGetPhpConfigs:
 class TestGetMysqlConfigs:
     """Tests for get_mysql_configs function."""
 
-    def test_find_my_cnf(self, temp_dir):
+    def test_find_my_cnf(self, tmp_path):
         """Test finding my.cnf."""
-        my_cnf = temp_dir / "my.cnf"
+        my_cnf = tmp_path / "my.cnf"
         my_cnf.write_text("[mysqld]")
 
         with patch.object(config_files, '_find_file', side_effect=[
@@ -162,7 +159,7 @@ class TestGetAllConfigs:
 
         assert isinstance(result, dict)
 
-    def test_groups_by_category(self, temp_dir):
+    def test_groups_by_category(self, tmp_path):
         """Test that configs are grouped by category."""
         nginx_conf = ConfigFile("nginx.conf", "/etc/nginx/nginx.conf", "nginx")
         php_conf = ConfigFile("php-fpm.conf", "/etc/php-fpm.conf", "php")
@@ -1,10 +1,6 @@
 """Tests for services.py module."""
 
 import pytest
-from pathlib import Path
-
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from php_stack_tray.services import ServiceDefinition, ServiceRegistry, DEFAULT_SERVICES
 
@@ -132,53 +128,48 @@ class TestServiceRegistry:
         assert len(services) == len(DEFAULT_SERVICES)
 
 
+@pytest.fixture(scope="module")
+def default_service_names():
+    """Name set of DEFAULT_SERVICES, computed once per module."""
+    return {s.name for s in DEFAULT_SERVICES}
+
+
+@pytest.fixture(scope="module")
+def services_by_name():
+    """Name -> definition map of DEFAULT_SERVICES, built once per module."""
+    return {s.name: s for s in DEFAULT_SERVICES}
+
+
 class TestDefaultServices:
     """Tests for DEFAULT_SERVICES list."""
 
-    def test_nginx_included(self):
-        """Test that nginx is in default services."""
-        names = [s.name for s in DEFAULT_SERVICES]
-        assert "nginx" in names
-
-    def test_php_fpm_included(self):
-        """Test that php-fpm is in default services."""
-        names = [s.name for s in DEFAULT_SERVICES]
-        assert "php-fpm" in names
+    @pytest.mark.parametrize("name", [
+        "nginx", "php-fpm", "redis", "postgresql",
+        "mariadb", "mysql", "apache2", "httpd",
+    ])
+    def test_included(self, name, default_service_names):
+        """Test that the expected services are in default services."""
+        assert name in default_service_names
 
-    def test_mariadb_mysql_conflict(self):
+    def test_mariadb_mysql_conflict(self, services_by_name):
         """Test that mariadb and mysql have conflict defined."""
-        mariadb = next((s for s in DEFAULT_SERVICES if s.name == "mariadb"), None)
-        mysql = next((s for s in DEFAULT_SERVICES if s.name == "mysql"), None)
+        mariadb = services_by_name["mariadb"]
+        mysql = services_by_name["mysql"]
 
-        assert mariadb is not None
-        assert mysql is not None
         assert "mysql" in mariadb.conflicts
         assert "mariadb" in mysql.conflicts
 
-    def test_apache_httpd_conflict(self):
+    def test_apache_httpd_conflict(self, services_by_name):
         """Test that apache2 and httpd have conflict defined."""
-        apache2 = next((s for s in DEFAULT_SERVICES if s.name == "apache2"), None)
-        httpd = next((s for s in DEFAULT_SERVICES if s.name == "httpd"), None)
+        apache2 = services_by_name["apache2"]
+        httpd = services_by_name["httpd"]
 
-        assert apache2 is not None
-        assert httpd is not None
         assert "httpd" in apache2.conflicts
         assert "apache2" in httpd.conflicts
 
-    def test_redis_included(self):
-        """Test that redis is in default services."""
-        names = [s.name for s in DEFAULT_SERVICES]
-        assert "redis" in names
-
-    def test_postgresql_included(self):
-        """Test that postgresql is in default services."""
-        names = [s.name for s in DEFAULT_SERVICES]
-        assert "postgresql" in names
-
-    def test_php_fpm_has_version_cmd(self):
+    def test_php_fpm_has_version_cmd(self, services_by_name):
         """Test that php-fpm has version command defined."""
-        php_fpm = next((s for s in DEFAULT_SERVICES if s.name == "php-fpm"), None)
+        php_fpm = services_by_name["php-fpm"]
 
-        assert php_fpm is not None
         assert php_fpm.version_cmd is not None
         assert "php" in php_fpm.version_cmd
@@ -1,11 +1,6 @@
 """Tests for vhosts.py module."""
 
 import pytest
-from pathlib import Path
-from unittest.mock import patch, MagicMock
-
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from php_stack_tray import vhosts
 
@@ -13,85 +8,89 @@ from php_stack_tray import vhosts
 class TestParseVhostConfig:
     """Tests for _parse_vhost_config function."""
 
-    def test_parse_server_name(self, temp_dir, sample_vhost_config):
+    def test_parse_server_name(self, sample_vhost_config_file):
         """Test parsing server_name from config."""
-        config_file = temp_dir / "test.conf"
-        config_file.write_text(sample_vhost_config)
-
-        server_name, document_root = vhosts._parse_vhost_config(config_file)
+        server_name, document_root, php_socket = vhosts._parse_vhost_config(
+            sample_vhost_config_file
+        )
 
         assert server_name == "example.local"
 
-    def test_parse_document_root(self, temp_dir, sample_vhost_config):
+    def test_parse_document_root(self, sample_vhost_config_file):
         """Test parsing root from config."""
-        config_file = temp_dir / "test.conf"
-        config_file.write_text(sample_vhost_config)
-
-        server_name, document_root = vhosts._parse_vhost_config(config_file)
+        server_name, document_root, php_socket = vhosts._parse_vhost_config(
+            sample_vhost_config_file
+        )
 
         assert document_root == "/var/www/example"
 
-    def test_parse_multiple_server_names(self, temp_dir):
+    def test_parse_php_socket(self, sample_vhost_config_file):
+        """Test parsing fastcgi_pass socket from config."""
+        server_name, document_root, php_socket = vhosts._parse_vhost_config(
+            sample_vhost_config_file
+        )
+
+        assert php_socket == "/run/php-fpm/php-fpm.sock"
+
+    def test_parse_multiple_server_names(self, tmp_path):
         """Test parsing config with multiple server names."""
         config = """server {
     server_name example.local www.example.local;
     root /var/www/example;
 }"""
-        config_file = temp_dir / "test.conf"
+        config_file = tmp_path / "test.conf"
         config_file.write_text(config)
 
-        server_name, document_root = vhosts._parse_vhost_config(config_file)
+        server_name, document_root, php_socket = vhosts._parse_vhost_config(config_file)
 
         assert server_name == "example.local www.example.local"
 
-    def test_parse_missing_server_name(self, temp_dir):
+    def test_parse_missing_server_name(self, tmp_path):
         """Test parsing config without server_name."""
         config = """server {
     root /var/www/example;
 }"""
-        config_file = temp_dir / "test.conf"
+        config_file = tmp_path / "test.conf"
         config_file.write_text(config)
 
-        server_name, document_root = vhosts._parse_vhost_config(config_file)
+        server_name, document_root, php_socket = vhosts._parse_vhost_config(config_file)
 
         assert server_name is None
         assert document_root == "/var/www/example"
 
-    def test_parse_nonexistent_file(self, temp_dir):
+    def test_parse_nonexistent_file(self, tmp_path):
         """Test parsing non-existent file returns None."""
-        config_file = temp_dir / "nonexistent.conf"
+        config_file = tmp_path / "nonexistent.conf"
 
-        server_name, document_root = vhosts._parse_vhost_config(config_file)
+        server_name, document_root, php_socket = vhosts._parse_vhost_config(config_file)
 
         assert server_name is None
         assert document_root is None
+        assert php_socket is None
 
 
 class TestIsVhostConfig:
     """Tests for _is_vhost_config function."""
 
-    def test_valid_vhost_config(self, temp_dir, sample_vhost_config):
+    def test_valid_vhost_config(self, sample_vhost_config_file):
         """Test detection of valid vhost config."""
-        config_file = temp_dir / "test.conf"
-        config_file.write_text(sample_vhost_config)
-
-        assert vhosts._is_vhost_config(config_file) is True
+        assert vhosts._is_vhost_config(sample_vhost_config_file) is True
 
-    def test_non_vhost_config(self, temp_dir):
+    def test_non_vhost_config(self, tmp_path):
         """Test detection of non-vhost config (no server block)."""
         config = """# Some other nginx config
 upstream backend {
     server 127.0.0.1:8080;
 }
 """
-        config_file = temp_dir / "upstream.conf"
+        config_file = tmp_path / "upstream.conf"
         config_file.write_text(config)
 
         assert vhosts._is_vhost_config(config_file) is False
 
-    def test_empty_file(self, temp_dir):
+    def test_empty_file(self, tmp_path):
         """Test empty file returns False."""
-        config_file = temp_dir / "empty.conf"
+        config_file = tmp_path / "empty.conf"
         config_file.write_text("")
 
         assert vhosts._is_vhost_config(config_file) is False
@@ -100,36 +99,36 @@ upstream backend {
 class TestDetectNginxStyle:
     """Tests for _detect_nginx_style function."""
 
-    def test_detect_debian_style(self, temp_dir):
+    def test_detect_debian_style(self, tmp_path, monkeypatch):
         """Test detection of Debian-style nginx config."""
-        sites_available = temp_dir / "sites-available"
+        sites_available = tmp_path / "sites-available"
         sites_available.mkdir()
 
-        with patch.object(vhosts, 'NGINX_PATHS', {
+        monkeypatch.setattr(vhosts, 'NGINX_PATHS', {
             "debian": {
                 "available": sites_available,
-                "enabled": temp_dir / "sites-enabled",
+                "enabled": tmp_path / "sites-enabled",
                 "uses_symlinks": True,
             },
             "conf.d": {
-                "available": temp_dir / "conf.d",
-                "enabled": temp_dir / "conf.d",
+                "available": tmp_path / "conf.d",
+                "enabled": tmp_path / "conf.d",
                 "uses_symlinks": False,
             },
-        }):
-            style = vhosts._detect_nginx_style()
-            assert style["uses_symlinks"] is True
-            assert style["available"] == sites_available
+        })
+        style = vhosts._detect_nginx_style()
+        assert style["uses_symlinks"] is True
+        assert style["available"] == sites_available
 
-    def test_detect_confd_style(self, temp_dir):
+    def test_detect_confd_style(self, tmp_path, monkeypatch):
         """Test detection of conf.d-style nginx config."""
-        conf_d = temp_dir / "conf.d"
+        conf_d = tmp_path / "conf.d"
         conf_d.mkdir()
 
-        with patch.object(vhosts, 'NGINX_PATHS', {
+        monkeypatch.setattr(vhosts, 'NGINX_PATHS', {
             "debian": {
-                "available": temp_dir / "sites-available",  # doesn't exist
-                "enabled": temp_dir / "sites-enabled",
+                "available": tmp_path / "sites-available",  # doesn't exist
+                "enabled": tmp_path / "sites-enabled",
                 "uses_symlinks": True,
             },
             "conf.d": {
@@ -137,33 +136,34 @@ class TestDetectNginxStyle:
                 "enabled": conf_d,
                 "uses_symlinks": False,
             },
-        }):
-            style = vhosts._detect_nginx_style()
-            assert style["uses_symlinks"] is False
-            assert style["available"] == conf_d
+        })
+        style = vhosts._detect_nginx_style()
+        assert style["uses_symlinks"] is False
+        assert style["available"] == conf_d
 
 
 class TestDetectPhpFpmSocket:
     """Tests for _detect_php_fpm_socket function."""
 
-    def test_detect_existing_socket(self, temp_dir):
+    def test_detect_existing_socket(self, tmp_path, monkeypatch):
         """Test detection of existing PHP-FPM socket."""
-        socket_path = temp_dir / "php-fpm.sock"
+        socket_path = tmp_path / "php-fpm.sock"
         socket_path.touch()
 
-        with patch.object(vhosts, 'PHP_FPM_SOCKET_PATHS', [str(socket_path)]):
-            result = vhosts._detect_php_fpm_socket()
-            assert result == str(socket_path)
+        monkeypatch.setattr(vhosts, 'PHP_FPM_SOCKET_PATTERNS',
+                            [(str(socket_path), "Default")])
+        result = vhosts._detect_php_fpm_socket()
+        assert result == str(socket_path)
 
-    def test_fallback_when_no_socket(self, temp_dir):
+    def test_fallback_when_no_socket(self, tmp_path, monkeypatch):
         """Test fallback when no socket exists."""
-        with patch.object(vhosts, 'PHP_FPM_SOCKET_PATHS', [
-            str(temp_dir / "nonexistent1.sock"),
-            str(temp_dir / "nonexistent2.sock"),
-        ]):
-            result = vhosts._detect_php_fpm_socket()
-            # Should return default fallback
-            assert result == "/run/php-fpm/php-fpm.sock"
+        monkeypatch.setattr(vhosts, 'PHP_FPM_SOCKET_PATTERNS', [
+            (str(tmp_path / "nonexistent1.sock"), "Default"),
+            (str(tmp_path / "nonexistent2.sock"), "8.3"),
+        ])
+        result = vhosts._detect_php_fpm_socket()
+        # Should return default fallback
+        assert result == "/run/php-fpm/php-fpm.sock"
 
 
 class TestGetVhostTemplate:
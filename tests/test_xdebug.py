@@ -1,122 +1,103 @@
 """Tests for xdebug.py module."""
 
 import pytest
-from pathlib import Path
-from unittest.mock import patch
-
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from php_stack_tray import xdebug
 
 
 class TestIsCommentedConfig:
-    """Tests for _is_commented_config function."""
+    """Tests for _is_commented_config / _is_commented_text."""
 
-    def test_enabled_config(self, temp_dir, sample_xdebug_config_enabled):
+    def test_enabled_config(self, sample_xdebug_config_enabled):
         """Test detection of enabled (uncommented) config."""
-        config_file = temp_dir / "xdebug.ini"
-        config_file.write_text(sample_xdebug_config_enabled)
-
-        assert xdebug._is_commented_config(config_file) is False
+        assert xdebug._is_commented_text(
+            sample_xdebug_config_enabled.encode()) is False
 
-    def test_disabled_config(self, temp_dir, sample_xdebug_config_disabled):
+    def test_disabled_config(self, sample_xdebug_config_disabled):
         """Test detection of disabled (commented) config."""
-        config_file = temp_dir / "xdebug.ini"
-        config_file.write_text(sample_xdebug_config_disabled)
-
-        assert xdebug._is_commented_config(config_file) is True
+        assert xdebug._is_commented_text(
+            sample_xdebug_config_disabled.encode()) is True
 
-    def test_config_with_spaces(self, temp_dir):
+    def test_config_with_spaces(self):
         """Test detection with spaces around semicolon."""
-        config = """  ; zend_extension=xdebug
+        config = b"""  ; zend_extension=xdebug
 xdebug.mode=debug
 """
-        config_file = temp_dir / "xdebug.ini"
-        config_file.write_text(config)
+        assert xdebug._is_commented_text(config) is True
 
-        assert xdebug._is_commented_config(config_file) is True
-
-    def test_config_without_zend_extension(self, temp_dir):
+    def test_config_without_zend_extension(self):
         """Test config without zend_extension line."""
-        config = """xdebug.mode=debug
+        config = b"""xdebug.mode=debug
 xdebug.client_host=localhost
 """
-        config_file = temp_dir / "xdebug.ini"
-        config_file.write_text(config)
-
         # No zend_extension line = treated as disabled
-        assert xdebug._is_commented_config(config_file) is True
+        assert xdebug._is_commented_text(config) is True
 
-    def test_nonexistent_file(self, temp_dir):
+    def test_nonexistent_file(self, tmp_path):
         """Test non-existent file returns True (disabled)."""
-        config_file = temp_dir / "nonexistent.ini"
+        config_file = tmp_path / "nonexistent.ini"
 
         assert xdebug._is_commented_config(config_file) is True
 
-    def test_zend_extension_with_path(self, temp_dir):
+    def test_zend_extension_with_path(self):
         """Test detection with full path to xdebug.so."""
-        config = """zend_extension=/usr/lib/php/modules/xdebug.so
+        config = b"""zend_extension=/usr/lib/php/modules/xdebug.so
 xdebug.mode=debug
 """
-        config_file = temp_dir / "xdebug.ini"
-        config_file.write_text(config)
-
-        assert xdebug._is_commented_config(config_file) is False
+        assert xdebug._is_commented_text(config) is False
 
 
 class TestGetXdebugConfigPath:
     """Tests for get_xdebug_config_path function."""
 
-    def test_find_existing_config(self, temp_dir):
+    def test_find_existing_config(self, tmp_path, monkeypatch):
         """Test finding existing config file."""
-        config_file = temp_dir / "xdebug.ini"
+        config_file = tmp_path / "xdebug.ini"
         config_file.write_text("zend_extension=xdebug")
 
-        with patch.object(xdebug, 'XDEBUG_CONFIG_PATHS', [str(config_file)]):
-            result = xdebug.get_xdebug_config_path()
-            assert result == config_file
+        monkeypatch.setattr(xdebug, 'XDEBUG_CONFIG_PATHS', [str(config_file)])
+        result = xdebug.get_xdebug_config_path()
+        assert result == config_file
 
-    def test_find_disabled_config(self, temp_dir):
+    def test_find_disabled_config(self, tmp_path, monkeypatch):
         """Test finding .disabled config file."""
-        disabled_file = temp_dir / "xdebug.ini.disabled"
+        disabled_file = tmp_path / "xdebug.ini.disabled"
         disabled_file.write_text(";zend_extension=xdebug")
 
-        with patch.object(xdebug, 'XDEBUG_CONFIG_PATHS', [
-            str(temp_dir / "xdebug.ini"),  # doesn't exist
-        ]):
-            result = xdebug.get_xdebug_config_path()
-            assert result == disabled_file
+        monkeypatch.setattr(xdebug, 'XDEBUG_CONFIG_PATHS', [
+            str(tmp_path / "xdebug.ini"),  # doesn't exist
+        ])
+        result = xdebug.get_xdebug_config_path()
+        assert result == disabled_file
 
-    def test_no_config_found(self, temp_dir):
+    def test_no_config_found(self, tmp_path, monkeypatch):
         """Test when no config file exists."""
-        with patch.object(xdebug, 'XDEBUG_CONFIG_PATHS', [
-            str(temp_dir / "nonexistent1.ini"),
-            str(temp_dir / "nonexistent2.ini"),
-        ]):
-            result = xdebug.get_xdebug_config_path()
-            assert result is None
+        monkeypatch.setattr(xdebug, 'XDEBUG_CONFIG_PATHS', [
+            str(tmp_path / "nonexistent1.ini"),
+            str(tmp_path / "nonexistent2.ini"),
+        ])
+        result = xdebug.get_xdebug_config_path()
+        assert result is None
 
 
-class TestXdebugConfigPaths:
-    """Tests for XDEBUG_CONFIG_PATHS coverage."""
+@pytest.fixture(scope="module")
+def xdebug_paths_set():
+    """Path set of XDEBUG_CONFIG_PATHS, computed once per module."""
+    return set(xdebug.XDEBUG_CONFIG_PATHS)
 
-    def test_arch_paths_included(self):
-        """Test that Arch Linux paths are included."""
-        paths_str = " ".join(xdebug.XDEBUG_CONFIG_PATHS)
-        assert "/etc/php/conf.d/xdebug.ini" in paths_str
 
-    def test_debian_paths_included(self):
-        """Test that Debian/Ubuntu paths are included."""
-        paths_str = " ".join(xdebug.XDEBUG_CONFIG_PATHS)
-        assert "/etc/php/8.2/mods-available/xdebug.ini" in paths_str
+class TestXdebugConfigPaths:
+    """Tests for XDEBUG_CONFIG_PATHS coverage."""
 
-    def test_fedora_paths_included(self):
-        """Test that Fedora/RHEL paths are included."""
-        paths_str = " ".join(xdebug.XDEBUG_CONFIG_PATHS)
-        assert "/etc/php.d/xdebug.ini" in paths_str
+    @pytest.mark.parametrize("path", [
+        "/etc/php/conf.d/xdebug.ini",            # Arch Linux
+        "/etc/php/8.2/mods-available/xdebug.ini",  # Debian/Ubuntu
+        "/etc/php.d/xdebug.ini",                 # Fedora/RHEL
+    ])
+    def test_distro_paths_included(self, path, xdebug_paths_set):
+        """Test that per-distro paths are included."""
+        assert path in xdebug_paths_set
 
-    def test_versioned_paths_included(self):
+    def test_versioned_paths_included(self, xdebug_paths_set):
         """Test that versioned PHP paths are included."""
-        paths_str = " ".join(xdebug.XDEBUG_CONFIG_PATHS)
-        assert "php82" in paths_str or "php83" in paths_str
+        assert any("php82" in p or "php83" in p for p in xdebug_paths_set)